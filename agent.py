@@ -15,7 +15,7 @@ from datetime import datetime
 from pathlib import Path
 
 from .core.config import MAAConfig
-from .core.task_presets import get_preset, list_presets, merge_preset_with_params
+from .core.task_presets import get_preset, get_preset_view, list_presets, merge_preset_with_params
 from .core.task_param_schemas import get_task_catalog
 
 from .enhanced.emulator_manager import EmulatorManager, DeviceStatus
@@ -150,7 +150,7 @@ class MAAAgent:
 
         # === 预检查: 提供具体的错误信息 ===
         preset_name = task.get("preset")
-        if preset_name and not get_preset(preset_name):
+        if preset_name and get_preset_view(preset_name) is None:
             available = list_presets()
             return {
                 "status": "error",
@@ -457,53 +457,55 @@ class MAAAgent:
         """配置 MAA"""
         results = []
 
-        # MAA 路径
-        if "maa_path" in task:
-            path = task["maa_path"]
-            valid, msg = self.config.validate_maa_path(path)
-            if valid:
-                self.config.set_maa_path(path)
-                results.append({"item": "maa_path", "status": "success", "message": f"MAA 路径已设置: {path}"})
-            else:
-                results.append({"item": "maa_path", "status": "error", "message": msg})
-
-        # 连接地址
-        if "connect_address" in task:
-            addr = task["connect_address"]
-            self.config.set_connect_address(addr)
-            results.append({"item": "connect_address", "status": "success", "message": f"连接地址已设置: {addr}"})
-
-        # 通知回调地址
-        if "callback_url" in task:
-            url = task["callback_url"]
-            self.config.set_callback_url(url)
-            self.notifier.callback_url = url
-            results.append({"item": "callback_url", "status": "success", "message": f"回调地址已设置: {url}"})
-
-        # 模拟器配置
-        if "emulator_profiles" in task:
-            profiles = task["emulator_profiles"]
-            if isinstance(profiles, dict):
-                self.config.set_emulator_profiles(profiles)
-                self.emulator_manager.load_from_config(profiles)
-                results.append({"item": "emulator_profiles", "status": "success",
-                                "message": f"已配置 {len(profiles)} 个模拟器"})
-
-        # 脚本配置
-        if "script_profiles" in task:
-            profiles = task["script_profiles"]
-            if isinstance(profiles, dict):
-                self.config.set_script_profiles(profiles)
-                results.append({"item": "script_profiles", "status": "success",
-                                "message": f"已配置 {len(profiles)} 个脚本"})
-
-        # 定时任务
-        if "schedules" in task:
-            schedules = task["schedules"]
-            if isinstance(schedules, dict):
-                self.config.set_schedules(schedules)
-                results.append({"item": "schedules", "status": "success",
-                                "message": f"已配置 {len(schedules)} 个定时任务"})
+        # 多个配置项只在最后统一写盘一次
+        with self.config.batch():
+            # MAA 路径
+            if "maa_path" in task:
+                path = task["maa_path"]
+                valid, msg = self.config.validate_maa_path(path)
+                if valid:
+                    self.config.set_maa_path(path)
+                    results.append({"item": "maa_path", "status": "success", "message": f"MAA 路径已设置: {path}"})
+                else:
+                    results.append({"item": "maa_path", "status": "error", "message": msg})
+
+            # 连接地址
+            if "connect_address" in task:
+                addr = task["connect_address"]
+                self.config.set_connect_address(addr)
+                results.append({"item": "connect_address", "status": "success", "message": f"连接地址已设置: {addr}"})
+
+            # 通知回调地址
+            if "callback_url" in task:
+                url = task["callback_url"]
+                self.config.set_callback_url(url)
+                self.notifier.callback_url = url
+                results.append({"item": "callback_url", "status": "success", "message": f"回调地址已设置: {url}"})
+
+            # 模拟器配置
+            if "emulator_profiles" in task:
+                profiles = task["emulator_profiles"]
+                if isinstance(profiles, dict):
+                    self.config.set_emulator_profiles(profiles)
+                    self.emulator_manager.load_from_config(profiles)
+                    results.append({"item": "emulator_profiles", "status": "success",
+                                    "message": f"已配置 {len(profiles)} 个模拟器"})
+
+            # 脚本配置
+            if "script_profiles" in task:
+                profiles = task["script_profiles"]
+                if isinstance(profiles, dict):
+                    self.config.set_script_profiles(profiles)
+                    results.append({"item": "script_profiles", "status": "success",
+                                    "message": f"已配置 {len(profiles)} 个脚本"})
+
+            # 定时任务
+            if "schedules" in task:
+                schedules = task["schedules"]
+                if isinstance(schedules, dict):
+                    self.config.set_schedules(schedules)
+                    results.append({"item": "schedules", "status": "success",
+                                    "message": f"已配置 {len(schedules)} 个定时任务"})
 
         if not results:
             return {
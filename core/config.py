@@ -1,15 +1,38 @@
 """配置管理模块 - 替代 agent_comms，使用 JSON 文件持久化所有配置"""
 
+import atexit
+import copy
+import functools
 import json
 import logging
+import mmap
+import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Mapping, Optional
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
 
 logger = logging.getLogger(__name__)
 
-# 项目根目录
-_PROJECT_ROOT = Path(__file__).resolve().parent.parent
-_CONFIG_FILE = _PROJECT_ROOT / ".agent_maa_config.json"
+# 保护单例创建，避免并发首次访问时重复加载
+_singleton_lock = threading.Lock()
+
+_CONFIG_FILENAME = ".agent_maa_config.json"
+
+# 读取配置文件的缓冲区大小，常见配置一次 read 即可读完
+_READ_BUFFER_SIZE = 64 * 1024
+# 超过该大小且有 orjson 时改用 mmap 解析，省去一次整文件拷贝
+_MMAP_THRESHOLD = 1024 * 1024
+
+# 连续修改合并写盘的防抖间隔（秒）
+_FLUSH_DELAY = 0.05
 
 _DEFAULT_CONFIG = {
     "maa_path": None,
@@ -21,6 +44,82 @@ _DEFAULT_CONFIG = {
     "last_params": {},
 }
 
+# update() 允许写入的顶层键
+_ALLOWED_KEYS = frozenset(_DEFAULT_CONFIG)
+
+# 只读空映射，避免每次查询都构造新的 {}
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """序列化为 UTF-8 JSON 字节（优先使用 orjson）"""
+    if _HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    if _HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _read_config(path: Path) -> Any:
+    with open(path, "rb", buffering=_READ_BUFFER_SIZE) as f:
+        if _HAS_ORJSON and os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+        return _loads(f.read())
+
+
+def _write_bytes(path: Path, payload: bytes) -> None:
+    """
+    原子写入：先写临时文件并 fsync，再 os.replace 覆盖目标
+
+    写入中途崩溃只会留下临时文件，原配置保持完整。
+    """
+    tmp = path.with_suffix(".json.tmp")
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(tmp, flags, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+
+
+@functools.lru_cache(maxsize=16)
+def _validate_maa_dir(path: str, mtime_ns: int) -> tuple[bool, str]:
+    """检查 MAA 目录结构，结果按 (路径, 目录 mtime) 缓存"""
+    # 单次目录枚举代替逐个 stat；Windows 文件名不区分大小写
+    try:
+        with os.scandir(path) as it:
+            entries = {e.name.lower(): e for e in it}
+    except NotADirectoryError:
+        return False, f"路径不是目录: {path}"
+    except OSError:
+        return False, f"路径不存在: {path}"
+    maa_exe = entries.get("maa.exe")
+    if maa_exe is None or not maa_exe.is_file():
+        return False, f"未找到 MAA.exe: {Path(path) / 'MAA.exe'}"
+    config_dir = entries.get("config")
+    if config_dir is None or not config_dir.is_dir():
+        return False, f"未找到 config 目录: {Path(path) / 'config'}"
+    return True, "路径有效"
+
+
+def _unchanged(current: Any, value: Any) -> bool:
+    """
+    新值与当前值相等时可跳过写盘
+
+    同一对象视为已修改：调用方可能原地改完再传回（如 script_profiles.update）。
+    """
+    return current is not value and current == value
+
 
 class MAAConfig:
     """
@@ -31,42 +130,165 @@ class MAAConfig:
     """
 
     _instance: Optional["MAAConfig"] = None
-    _data: Dict[str, Any] = {}
+    # 配置文件路径，首次使用时再解析项目根目录
+    _config_path: Optional[Path] = None
+    _data: Dict[str, Any]
+    _last_params: Dict[str, Dict[str, Any]]
 
     def __new__(cls) -> "MAAConfig":
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._load()
+            with _singleton_lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._batch_depth = 0
+                    instance._dirty = False
+                    instance._flush_timer = None
+                    instance._maa_paths = None
+                    instance._lock = threading.RLock()
+                    # 进程退出前确保防抖中的修改落盘
+                    atexit.register(instance.flush)
+                    # 初始化完成后再发布，其他线程不会拿到半成品
+                    cls._instance = instance
         return cls._instance
 
     # ---- 内部 I/O ----
 
+    @classmethod
+    def _config_file(cls) -> Path:
+        if cls._config_path is None:
+            # 项目根目录
+            cls._config_path = Path(__file__).resolve().parent.parent / _CONFIG_FILENAME
+        return cls._config_path
+
+    def __getattr__(self, name: str) -> Any:
+        # 配置延迟到首次访问 _data / _last_params 时才读盘
+        if name in ("_data", "_last_params"):
+            with self._lock:
+                if name not in self.__dict__:
+                    self._load()
+            return self.__dict__[name]
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
     def _load(self) -> None:
-        if _CONFIG_FILE.exists():
+        data: Dict[str, Any] = {}
+        config_file = self._config_file()
+        if os.path.isfile(config_file):
             try:
-                self._data = json.loads(_CONFIG_FILE.read_text(encoding="utf-8"))
-            except (json.JSONDecodeError, OSError) as e:
+                data = _read_config(config_file)
+            except (ValueError, OSError) as e:
                 logger.warning(f"配置文件读取失败，使用默认配置: {e}")
-                self._data = dict(_DEFAULT_CONFIG)
-        else:
-            self._data = dict(_DEFAULT_CONFIG)
 
-        # 合并缺失的默认键
+        # 合并缺失的默认键（深拷贝，避免修改共享的默认字典）
         for key, default_val in _DEFAULT_CONFIG.items():
-            if key not in self._data:
-                self._data[key] = default_val
-
-    def _save(self) -> None:
+            if key not in data:
+                data[key] = copy.deepcopy(default_val)
+        # 合并完成后再赋值，并发读取不会看到缺键的中间状态
+        self._data = data
+        self._last_params = data["last_params"]
+
+    def _save(self) -> bool:
+        """写盘，失败时记录日志并返回 False"""
+        try:
+            raw = _dumps(self._data)
+        except (TypeError, ValueError) as e:
+            # orjson.JSONEncodeError 是 TypeError 的子类
+            logger.error(f"配置序列化失败: {e}")
+            return False
         try:
-            _CONFIG_FILE.write_text(
-                json.dumps(self._data, ensure_ascii=False, indent=2),
-                encoding="utf-8",
-            )
+            _write_bytes(self._config_file(), raw)
         except OSError as e:
             logger.error(f"配置文件保存失败: {e}")
+            return False
+        return True
+
+    def _mark_dirty(self) -> None:
+        """标记配置已修改，短暂防抖后由后台定时器统一写盘"""
+        with self._lock:
+            self._dirty = True
+            # batch() 内只标记脏位，退出时统一写盘
+            if self._batch_depth > 0:
+                return
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            self._flush_timer = threading.Timer(_FLUSH_DELAY, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self) -> None:
+        """立即写入所有未保存的修改"""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            if not self._save():
+                # 保留脏位，之后的写盘或退出时的 flush 会重试
+                self._dirty = True
+
+    def save_now(self) -> None:
+        """同步写盘，不等待防抖（用于关键配置）"""
+        with self._lock:
+            self._dirty = True
+            if self._batch_depth == 0:
+                self.flush()
 
     def reload(self) -> None:
-        self._load()
+        with self._lock:
+            # 先落盘未保存的修改，避免被磁盘内容覆盖
+            self.flush()
+            self._load()
+
+    @contextmanager
+    def batch(self) -> Iterator["MAAConfig"]:
+        """
+        批量修改上下文：块内的所有 set_* / delete_* 只在退出时写盘一次
+
+        可嵌套，最外层退出时才落盘::
+
+            with config.batch():
+                config.set_emulator_profiles(...)
+                config.set_script_profiles(...)
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self.flush()
+
+    # ---- 通用读写 ----
+
+    def _set_value(self, key: str, value: Any) -> bool:
+        """设置顶层配置项，值未变化时返回 False 且不写盘"""
+        with self._lock:
+            if _unchanged(self._data.get(key), value):
+                return False
+            self._data[key] = value
+            self._mark_dirty()
+            return True
+
+    def _set_item(self, section: str, item_id: str, value: Any) -> None:
+        """设置分区（emulator_profiles 等）中的单个条目"""
+        with self._lock:
+            items = self._data.setdefault(section, {})
+            if _unchanged(items.get(item_id), value):
+                return
+            items[item_id] = value
+            self._mark_dirty()
+
+    def _delete_item(self, section: str, item_id: str) -> bool:
+        with self._lock:
+            items = self._data.get(section, {})
+            if item_id in items:
+                del items[item_id]
+                self._mark_dirty()
+                return True
+            return False
 
     # ---- MAA 路径 ----
 
@@ -74,37 +296,41 @@ class MAAConfig:
         return self._data.get("maa_path")
 
     def set_maa_path(self, path: str) -> None:
-        self._data["maa_path"] = path
-        self._save()
+        with self._lock:
+            if self._set_value("maa_path", path):
+                _validate_maa_dir.cache_clear()
+                self.save_now()
 
     def validate_maa_path(self, path: Optional[str] = None) -> tuple[bool, str]:
         p = path or self.get_maa_path()
         if not p:
             return False, "MAA 路径未配置"
-        maa_dir = Path(p)
-        if not maa_dir.exists():
+        try:
+            # 目录内容变化会更新 mtime，以此作为缓存键
+            mtime_ns = os.stat(p).st_mtime_ns
+        except OSError:
             return False, f"路径不存在: {p}"
-        if not maa_dir.is_dir():
-            return False, f"路径不是目录: {p}"
-        maa_exe = maa_dir / "MAA.exe"
-        if not maa_exe.exists():
-            return False, f"未找到 MAA.exe: {maa_exe}"
-        config_dir = maa_dir / "config"
-        if not config_dir.exists():
-            return False, f"未找到 config 目录: {config_dir}"
-        return True, "路径有效"
+        return _validate_maa_dir(p, mtime_ns)
 
-    def get_maa_exe_path(self) -> Optional[Path]:
+    def _derived_maa_paths(self) -> Optional[tuple[Path, Path]]:
+        """返回 (MAA.exe, config 目录)，按当前 maa_path 缓存"""
         p = self.get_maa_path()
-        if p:
-            return Path(p) / "MAA.exe"
-        return None
+        if not p:
+            return None
+        cached = self._maa_paths
+        if cached is None or cached[0] != p:
+            maa_dir = Path(p)
+            cached = (p, maa_dir / "MAA.exe", maa_dir / "config")
+            self._maa_paths = cached
+        return cached[1], cached[2]
+
+    def get_maa_exe_path(self) -> Optional[Path]:
+        paths = self._derived_maa_paths()
+        return paths[0] if paths else None
 
     def get_maa_config_dir(self) -> Optional[Path]:
-        p = self.get_maa_path()
-        if p:
-            return Path(p) / "config"
-        return None
+        paths = self._derived_maa_paths()
+        return paths[1] if paths else None
 
     # ---- 连接地址 ----
 
@@ -112,8 +338,7 @@ class MAAConfig:
         return self._data.get("connect_address")
 
     def set_connect_address(self, address: str) -> None:
-        self._data["connect_address"] = address
-        self._save()
+        self._set_value("connect_address", address)
 
     # ---- 模拟器配置 ----
 
@@ -121,26 +346,16 @@ class MAAConfig:
         return self._data.get("emulator_profiles", {})
 
     def set_emulator_profiles(self, profiles: Dict[str, Any]) -> None:
-        self._data["emulator_profiles"] = profiles
-        self._save()
+        self._set_value("emulator_profiles", profiles)
 
     def get_emulator_profile(self, profile_id: str) -> Optional[Dict[str, Any]]:
         return self.get_emulator_profiles().get(profile_id)
 
     def set_emulator_profile(self, profile_id: str, profile: Dict[str, Any]) -> None:
-        profiles = self.get_emulator_profiles()
-        profiles[profile_id] = profile
-        self._data["emulator_profiles"] = profiles
-        self._save()
+        self._set_item("emulator_profiles", profile_id, profile)
 
     def delete_emulator_profile(self, profile_id: str) -> bool:
-        profiles = self.get_emulator_profiles()
-        if profile_id in profiles:
-            del profiles[profile_id]
-            self._data["emulator_profiles"] = profiles
-            self._save()
-            return True
-        return False
+        return self._delete_item("emulator_profiles", profile_id)
 
     # ---- 脚本配置 ----
 
@@ -148,26 +363,16 @@ class MAAConfig:
         return self._data.get("script_profiles", {})
 
     def set_script_profiles(self, profiles: Dict[str, Any]) -> None:
-        self._data["script_profiles"] = profiles
-        self._save()
+        self._set_value("script_profiles", profiles)
 
     def get_script_profile(self, profile_id: str) -> Optional[Dict[str, Any]]:
         return self.get_script_profiles().get(profile_id)
 
     def set_script_profile(self, profile_id: str, profile: Dict[str, Any]) -> None:
-        profiles = self.get_script_profiles()
-        profiles[profile_id] = profile
-        self._data["script_profiles"] = profiles
-        self._save()
+        self._set_item("script_profiles", profile_id, profile)
 
     def delete_script_profile(self, profile_id: str) -> bool:
-        profiles = self.get_script_profiles()
-        if profile_id in profiles:
-            del profiles[profile_id]
-            self._data["script_profiles"] = profiles
-            self._save()
-            return True
-        return False
+        return self._delete_item("script_profiles", profile_id)
 
     # ---- 定时任务 ----
 
@@ -175,43 +380,30 @@ class MAAConfig:
         return self._data.get("schedules", {})
 
     def set_schedules(self, schedules: Dict[str, Any]) -> None:
-        self._data["schedules"] = schedules
-        self._save()
+        self._set_value("schedules", schedules)
 
     def get_schedule(self, schedule_id: str) -> Optional[Dict[str, Any]]:
         return self.get_schedules().get(schedule_id)
 
     def set_schedule(self, schedule_id: str, schedule: Dict[str, Any]) -> None:
-        schedules = self.get_schedules()
-        schedules[schedule_id] = schedule
-        self._data["schedules"] = schedules
-        self._save()
+        self._set_item("schedules", schedule_id, schedule)
 
     def delete_schedule(self, schedule_id: str) -> bool:
-        schedules = self.get_schedules()
-        if schedule_id in schedules:
-            del schedules[schedule_id]
-            self._data["schedules"] = schedules
-            self._save()
-            return True
-        return False
+        return self._delete_item("schedules", schedule_id)
 
     # ---- 上次任务参数 ----
 
-    def get_last_params(self, task_type: str) -> Dict[str, Any]:
-        """获取指定任务类型的上次使用参数"""
-        return self._data.get("last_params", {}).get(task_type, {})
+    def get_last_params(self, task_type: str) -> Mapping[str, Any]:
+        """获取指定任务类型的上次使用参数（未保存过时返回只读空映射）"""
+        return self._last_params.get(task_type, _EMPTY)
 
     def get_all_last_params(self) -> Dict[str, Dict[str, Any]]:
         """获取所有任务类型的上次使用参数"""
-        return self._data.get("last_params", {})
+        return self._last_params
 
     def set_last_params(self, task_type: str, params: Dict[str, Any]) -> None:
         """保存指定任务类型的本次参数"""
-        if "last_params" not in self._data:
-            self._data["last_params"] = {}
-        self._data["last_params"][task_type] = params
-        self._save()
+        self._set_item("last_params", task_type, params)
 
     # ---- 通知回调 ----
 
@@ -219,16 +411,18 @@ class MAAConfig:
         return self._data.get("callback_url")
 
     def set_callback_url(self, url: str) -> None:
-        self._data["callback_url"] = url
-        self._save()
+        self._set_value("callback_url", url)
 
     # ---- 批量更新 ----
 
     def update(self, **kwargs: Any) -> None:
-        for key, value in kwargs.items():
-            if key in _DEFAULT_CONFIG:
-                self._data[key] = value
-        self._save()
+        accepted = {k: v for k, v in kwargs.items() if k in _ALLOWED_KEYS}
+        if not accepted:
+            return
+        with self._lock:
+            self._data.update(accepted)
+            self._last_params = self._data["last_params"]
+            self._mark_dirty()
 
     def to_dict(self) -> Dict[str, Any]:
         return dict(self._data)
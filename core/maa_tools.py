@@ -1,12 +1,19 @@
 """MAA 控制工具实现 - 完整版本"""
 
 import asyncio
+import functools
 import sys
 import json
+import os
+import re
+import shutil
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Deque, Dict, List, NamedTuple, Optional, Tuple
 from threading import Thread, Lock
 from tempfile import gettempdir
 
@@ -70,14 +77,199 @@ from maa_comms.task_system.progress_callback import (
     STATUS_SUCCESS,
 )
 
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+try:
+    import ijson
+    _HAS_IJSON = True
+except ImportError:
+    _HAS_IJSON = False
+
+try:
+    import ahocorasick
+    _HAS_AHOCORASICK = True
+except ImportError:
+    _HAS_AHOCORASICK = False
+
+# 同一行日志命中多个任务时，按 MAA_TASKS_ZH 中的先后顺序取优先者
+_TASK_ZH_ORDER = {task_zh: i for i, task_zh in enumerate(MAA_TASKS_ZH)}
+
+if _HAS_AHOCORASICK:
+    _TASK_ZH_AUTOMATON = ahocorasick.Automaton()
+    for _task_zh in MAA_TASKS_ZH:
+        _TASK_ZH_AUTOMATON.add_word(_task_zh, _task_zh)
+    _TASK_ZH_AUTOMATON.make_automaton()
+else:
+    # 无 pyahocorasick 时用单个正则交替式一次扫描，长名称优先避免被前缀截断
+    _TASK_ZH_RE = re.compile(
+        "|".join(re.escape(t) for t in sorted(MAA_TASKS_ZH, key=len, reverse=True))
+    )
+
+
+# 任务状态中保留的最近日志条数（get_task_progress 最多返回 20 条）
+_RECENT_LOG_LIMIT = 20
+
+# 进程运行状态的复用时长（秒），高频轮询共享同一次检测
+_RUNNING_CACHE_TTL = 0.5
+
+# 保留的自动备份数量（auto_backup_*，按时间戳命名）
+_AUTO_BACKUP_KEEP = 10
+
+# 启动前路径/配置目录校验结果的复用时长（秒）
+_PRECHECK_TTL = 0.5
+
+# 刷理智计划的默认值，未指定的关卡填 "-"
+_PLAN_DATA_DEFAULT: Dict[str, Any] = {
+    "MedicineNumb": 0,
+    "SeriesNumb": 0,
+    "Stage": "-",
+    "Stage_1": "-",
+    "Stage_2": "-",
+    "Stage_3": "-",
+    "Stage_Remain": "-",
+}
+
+# _prepare_config 写入的 MAA 配置文件
+_MAA_CONFIG_FILES = ("gui.json", "gui.new.json")
+
+
+def _config_files_stamp(config_dir: Path) -> Tuple[Optional[Tuple[int, int]], ...]:
+    """配置文件的 (mtime_ns, size)，文件不存在时为 None"""
+    stamp = []
+    for name in _MAA_CONFIG_FILES:
+        try:
+            st = os.stat(config_dir / name)
+        except OSError:
+            stamp.append(None)
+        else:
+            stamp.append((st.st_mtime_ns, st.st_size))
+    return tuple(stamp)
+
+
+def _safe_tool_response(error_message: str):
+    """工具方法的统一异常处理：异常时返回 error 响应"""
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> Dict[str, Any]:
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                return {
+                    "status": "error",
+                    "message": f"{error_message}: {str(e)}",
+                    "data": {}
+                }
+
+        return wrapper
+
+    return decorator
+
+
+# 状态轮询路径上的配置读取缓存，仅在本模块的 set_* 中失效
+@functools.lru_cache(maxsize=1)
+def _cached_maa_path() -> Optional[str]:
+    return get_maa_path()
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_maa_exe() -> Optional[Path]:
+    return get_maa_exe_path()
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_connect_address() -> Optional[str]:
+    return get_saved_connect_address()
+
+
+def _read_update_package(gui_json: Path) -> str:
+    """读取 gui.json 中 Global 下的 VersionUpdate.package"""
+    if _HAS_IJSON:
+        # 流式解析，找到目标键即停止，不构建整棵 JSON 树
+        with open(gui_json, "rb") as f:
+            for prefix, event, value in ijson.parse(f):
+                if prefix == "Global.VersionUpdate.package" and event == "string":
+                    return value
+        return ""
+    # gui.json 体积较大，优先用 orjson 解析
+    raw = gui_json.read_bytes()
+    data = orjson.loads(raw) if _HAS_ORJSON else json.loads(raw)
+    return data.get("Global", {}).get("VersionUpdate.package", "")
+
+
+def _detect_task_type(logs: List[str]) -> Optional[str]:
+    """从最近 5 条日志中识别当前执行的任务类型（以最新命中的一行为准）"""
+    # 从最新一行往前找，每行只扫描一次，命中即停止
+    for log in reversed(logs[-5:]):
+        if _HAS_AHOCORASICK:
+            found = {task_zh for _, task_zh in _TASK_ZH_AUTOMATON.iter(log)}
+        else:
+            found = set(_TASK_ZH_RE.findall(log))
+        if found:
+            return min(found, key=_TASK_ZH_ORDER.__getitem__)
+    return None
+
+
+_MAA_TASKS_SET = frozenset(MAA_TASKS)
+_ALL_TASKS_DISABLED: Dict[str, bool] = dict.fromkeys(MAA_TASKS, False)
+
+# list_available_tasks 的返回内容全部是常量，导入时构建一次
+_LIST_TASKS_PAYLOAD: Dict[str, Any] = {
+    "status": "success",
+    "message": "任务列表获取成功",
+    "data": {
+        "tasks": tuple(
+            {"task_type": en_task, "display_name": zh_task}
+            for en_task, zh_task in zip(MAA_TASKS, MAA_TASKS_ZH)
+        ),
+        "fight_modes": (
+            {"value": "Routine", "name": "常规刷关"},
+            {"value": "Annihilation", "name": "剿灭作战"},
+        ),
+        "client_types": (
+            {"value": "Official", "name": "官服"},
+            {"value": "Bilibili", "name": "B服"},
+            {"value": "YoStarEN", "name": "国际服英文"},
+            {"value": "YoStarJP", "name": "日服"},
+            {"value": "YoStarKR", "name": "韩服"},
+            {"value": "txwy", "name": "繁中服"},
+        ),
+        "infrast_modes": (
+            {"value": "Normal", "name": "普通模式"},
+            {"value": "Custom", "name": "自定义模式"},
+        ),
+        "post_actions": (
+            {"value": "NoAction", "name": "无动作"},
+            {"value": "ExitGame", "name": "退出游戏"},
+            {"value": "ExitEmulator", "name": "退出模拟器"},
+        ),
+    },
+}
+
+
+class _HistoryRecord(NamedTuple):
+    """单条任务历史（元组存储，读取时再转为 dict）"""
+
+    task_type: str
+    status: str
+    start_time: str
+    end_time: str
+    duration: float
+    details: Dict[str, Any]
+
 
 class TaskHistory:
     """任务历史记录"""
 
     def __init__(self, max_size: int = 100):
         self.max_size = max_size
-        self.history: List[Dict[str, Any]] = []
-        self._lock = Lock()
+        # 新记录在左侧，超出 max_size 时自动淘汰最旧的记录；
+        # deque 的 appendleft / copy 本身是原子操作，读写都无需额外加锁
+        self.history: Deque[_HistoryRecord] = deque(maxlen=max_size)
 
     def add_record(
         self,
@@ -88,23 +280,32 @@ class TaskHistory:
         details: Optional[Dict[str, Any]] = None,
     ):
         """添加任务记录"""
-        with self._lock:
-            record = {
-                "task_type": task_type,
-                "status": status,
-                "start_time": start_time.strftime("%Y-%m-%d %H:%M:%S"),
-                "end_time": end_time.strftime("%Y-%m-%d %H:%M:%S"),
-                "duration": (end_time - start_time).total_seconds(),
-                "details": details or {},
-            }
-            self.history.insert(0, record)
-            if len(self.history) > self.max_size:
-                self.history = self.history[: self.max_size]
+        # isoformat 与 "%Y-%m-%d %H:%M:%S" 输出一致但更快
+        record = _HistoryRecord(
+            task_type,
+            status,
+            start_time.isoformat(sep=" ", timespec="seconds"),
+            end_time.isoformat(sep=" ", timespec="seconds"),
+            (end_time - start_time).total_seconds(),
+            details or {},
+        )
+        self.history.appendleft(record)
 
     def get_history(self, limit: int = 10) -> List[Dict[str, Any]]:
         """获取历史记录"""
-        with self._lock:
-            return self.history[:limit]
+        # 先整体复制再切片，避免遍历期间被并发写入打断
+        return [record._asdict() for record in islice(self.history.copy(), limit)]
+
+
+class _TaskState(NamedTuple):
+    """当前任务状态快照（不可变，整体替换）"""
+
+    status: str
+    task_type: str
+    logs: Tuple[str, ...]
+    latest_time: Optional[datetime]
+    # 任务开始时的 time.monotonic()，只用于计算运行时长
+    start_monotonic: Optional[float]
 
 
 class MAATools:
@@ -112,182 +313,166 @@ class MAATools:
 
     def __init__(self):
         # 任务状态
-        self._current_task_status = STATUS_RUNNING
-        self._current_logs: List[str] = []
-        self._latest_time: Optional[datetime] = None
-        self._current_task_type = "未知"
-        self._task_start_time: Optional[datetime] = None
+        # 读取方直接取 self._state 快照无需加锁，写入方在锁内整体替换
+        self._state = _TaskState(STATUS_RUNNING, "未知", (), None, None)
         self._lock = Lock()
 
         # 监控线程
         self._monitoring_thread: Optional[Thread] = None
+        # 长时间运行的 MAA 监控循环使用独立线程池，不占用默认线程池
+        self._maa_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="maa-run")
         self._stop_monitoring = False
 
+        # (maa_exe, 检测时间, 是否运行)
+        self._running_cache: Optional[tuple] = None
+        # (maa_path, 校验时间, maa_exe, config_dir)
+        self._precheck_cache: Optional[tuple] = None
+        # (maa_path, maa_exe, 状态中的静态字段)
+        self._status_static: Optional[tuple] = None
+        # config_dir -> (参数键, 写入后的配置文件戳)
+        self._prepare_cache: Dict[Path, tuple] = {}
+
         # 任务历史
         self._task_history = TaskHistory()
 
         # 备份目录
         self._backup_base_dir = Path(gettempdir()) / "maa_control_backups"
         self._backup_base_dir.mkdir(parents=True, exist_ok=True)
+        # 后台清理历史遗留的自动备份，不阻塞初始化
+        Thread(target=self._prune_old_backups, daemon=True).start()
 
     # ==================== 基础配置管理 ====================
 
+    @_safe_tool_response("设置 MAA 路径失败")
     async def set_maa_path(self, maa_path: Optional[str]) -> Dict[str, Any]:
         """设置 MAA 安装路径"""
-        try:
-            if not maa_path or not isinstance(maa_path, str):
-                return {
-                    "status": "error",
-                    "message": "请提供有效的 MAA 路径",
-                    "data": {}
-                }
-
-            # 验证路径
-            is_valid, msg = validate_maa_path(maa_path)
-            if not is_valid:
-                return {"status": "error", "message": msg, "data": {}}
-
-            # 保存路径
-            save_maa_path(maa_path)
-
-            return {
-                "status": "success",
-                "message": f"MAA 路径设置成功: {maa_path}",
-                "data": {
-                    "maa_path": str(Path(maa_path).resolve()),
-                    "maa_exe": str(Path(maa_path) / "MAA.exe"),
-                    "config_dir": str(Path(maa_path) / "config"),
-                }
-            }
-
-        except Exception as e:
+        if not maa_path or not isinstance(maa_path, str):
             return {
                 "status": "error",
-                "message": f"设置 MAA 路径失败: {str(e)}",
+                "message": "请提供有效的 MAA 路径",
                 "data": {}
             }
 
+        # 验证路径
+        is_valid, msg = validate_maa_path(maa_path)
+        if not is_valid:
+            return {"status": "error", "message": msg, "data": {}}
+
+        # 保存路径
+        save_maa_path(maa_path)
+        _cached_maa_path.cache_clear()
+        _cached_maa_exe.cache_clear()
+
+        maa_dir = Path(maa_path)
+        return {
+            "status": "success",
+            "message": f"MAA 路径设置成功: {maa_path}",
+            "data": {
+                "maa_path": str(maa_dir.resolve()),
+                "maa_exe": str(maa_dir / "MAA.exe"),
+                "config_dir": str(maa_dir / "config"),
+            }
+        }
+
+    @_safe_tool_response("获取 MAA 状态失败")
     async def get_maa_status(self) -> Dict[str, Any]:
         """获取 MAA 当前状态"""
-        try:
-            maa_path = get_maa_path()
-
-            # 检查是否已配置路径
-            if not maa_path:
-                return {
-                    "status": "success",
-                    "message": "MAA 未配置",
-                    "data": {
-                        "configured": False,
-                        "running": False,
-                        "maa_path": None,
-                    }
-                }
+        maa_path = _cached_maa_path()
 
-            # 验证路径
-            is_valid, msg = validate_maa_path(maa_path)
-            if not is_valid:
-                return {
-                    "status": "success",
-                    "message": f"MAA 路径无效: {msg}",
-                    "data": {
-                        "configured": True,
-                        "valid": False,
-                        "running": False,
-                        "maa_path": maa_path,
-                        "error": msg,
-                    }
+        # 检查是否已配置路径
+        if not maa_path:
+            return {
+                "status": "success",
+                "message": "MAA 未配置",
+                "data": {
+                    "configured": False,
+                    "running": False,
+                    "maa_path": None,
                 }
+            }
 
-            # 检查是否正在运行
-            maa_exe = get_maa_exe_path()
-            running = is_maa_running(maa_exe) if maa_exe else False
-
-            # 获取当前任务状态
-            with self._lock:
-                task_status = self._current_task_status
-                task_type = self._current_task_type
-                latest_logs = self._current_logs[-10:] if self._current_logs else []
-                task_start_time = self._task_start_time
-
-            # 计算运行时长
-            duration = None
-            if task_start_time:
-                duration = (datetime.now() - task_start_time).total_seconds()
-
+        # 验证路径
+        is_valid, msg = validate_maa_path(maa_path)
+        if not is_valid:
             return {
                 "status": "success",
-                "message": "MAA 状态获取成功",
+                "message": f"MAA 路径无效: {msg}",
                 "data": {
                     "configured": True,
-                    "valid": True,
-                    "running": running,
-                    "maa_path": str(Path(maa_path).resolve()),
-                    "maa_exe": str(maa_exe),
-                    "connect_address": get_saved_connect_address(),
-                    "task_status": task_status,
-                    "task_type": task_type,
-                    "duration_seconds": duration,
-                    "latest_logs": latest_logs,
-                    "is_finished": is_terminal_status(task_status),
+                    "valid": False,
+                    "running": False,
+                    "maa_path": maa_path,
+                    "error": msg,
                 }
             }
 
-        except Exception as e:
-            return {
-                "status": "error",
-                "message": f"获取 MAA 状态失败: {str(e)}",
-                "data": {}
+        # 检查是否正在运行
+        maa_exe = _cached_maa_exe()
+        running = await self._check_running(maa_exe)
+
+        # 获取当前任务状态
+        state = self._state
+        task_status = state.status
+        task_type = state.task_type
+        latest_logs = list(state.logs[-10:])
+        start_monotonic = state.start_monotonic
+
+        # 计算运行时长
+        duration = None
+        if start_monotonic is not None:
+            duration = time.monotonic() - start_monotonic
+
+        return {
+            "status": "success",
+            "message": "MAA 状态获取成功",
+            "data": {
+                **self._get_static_status(maa_path, maa_exe),
+                "running": running,
+                "connect_address": _cached_connect_address(),
+                "task_status": task_status,
+                "task_type": task_type,
+                "duration_seconds": duration,
+                "latest_logs": latest_logs,
+                "is_finished": is_terminal_status(task_status),
             }
+        }
 
+    @_safe_tool_response("设置连接地址失败")
     async def set_connect_address(self, address: Optional[str]) -> Dict[str, Any]:
         """设置连接地址"""
-        try:
-            if not address:
-                return {
-                    "status": "error",
-                    "message": "请提供有效的连接地址",
-                    "data": {}
-                }
-
-            save_connect_address(address)
-
-            return {
-                "status": "success",
-                "message": f"连接地址设置成功: {address}",
-                "data": {"connect_address": address}
-            }
-
-        except Exception as e:
+        if not address:
             return {
                 "status": "error",
-                "message": f"设置连接地址失败: {str(e)}",
+                "message": "请提供有效的连接地址",
                 "data": {}
             }
 
-    async def get_connect_address(self) -> Dict[str, Any]:
-        """获取连接地址"""
-        try:
-            address = get_saved_connect_address()
+        save_connect_address(address)
+        _cached_connect_address.cache_clear()
 
-            return {
-                "status": "success",
-                "message": "连接地址获取成功",
-                "data": {
-                    "connect_address": address,
-                    "configured": address is not None,
-                }
-            }
+        return {
+            "status": "success",
+            "message": f"连接地址设置成功: {address}",
+            "data": {"connect_address": address}
+        }
 
-        except Exception as e:
-            return {
-                "status": "error",
-                "message": f"获取连接地址失败: {str(e)}",
-                "data": {}
+    @_safe_tool_response("获取连接地址失败")
+    async def get_connect_address(self) -> Dict[str, Any]:
+        """获取连接地址"""
+        address = get_saved_connect_address()
+
+        return {
+            "status": "success",
+            "message": "连接地址获取成功",
+            "data": {
+                "connect_address": address,
+                "configured": address is not None,
             }
+        }
 
     # ==================== 任务执行 ====================
 
+    @_safe_tool_response("启动 MAA 任务失败")
     async def start_maa_task(
         self,
         tasks: Dict[str, bool],
@@ -315,136 +500,101 @@ class MAATools:
         auto_update: bool = False,
     ) -> Dict[str, Any]:
         """启动 MAA 执行任务"""
-        try:
-            # 检查 MAA 路径
-            maa_path = get_maa_path()
-            if not maa_path:
-                return {
-                    "status": "error",
-                    "message": "请先使用 set_maa_path 配置 MAA 路径",
-                    "data": {}
-                }
-
-            is_valid, msg = validate_maa_path(maa_path)
-            if not is_valid:
-                return {"status": "error", "message": f"MAA 路径无效: {msg}", "data": {}}
-
-            # 检查是否已在运行
-            maa_exe = get_maa_exe_path()
-            if is_maa_running(maa_exe):
-                return {
-                    "status": "error",
-                    "message": "MAA 已在运行中，请先停止当前任务",
-                    "data": {}
-                }
-
-            # 自动更新
-            if auto_update:
-                try:
-                    maa_update(Path(maa_path))
-                except Exception as e:
-                    pass  # 更新失败不影响后续流程
-
-            # 获取配置目录
-            config_dir = get_maa_config_dir()
-            if not config_dir or not config_dir.exists():
-                return {
-                    "status": "error",
-                    "message": "MAA 配置目录不存在，请先运行一次 MAA",
-                    "data": {}
-                }
+        # 检查 MAA 路径、运行状态与配置目录
+        error, maa_path, maa_exe, config_dir = await self._precheck_ready()
+        if error:
+            return error
 
-            # 备份配置
-            backup_dir = None
-            if backup_before_run:
-                backup_dir = self._backup_base_dir / f"auto_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-                backup_config_dir(config_dir, backup_dir)
+        maa_root = Path(maa_path)
 
-            # 加载和修改配置
+        # 自动更新
+        if auto_update:
             try:
-                self._prepare_config(
-                    config_dir=config_dir,
-                    tasks=tasks,
-                    fight_mode=fight_mode,
-                    medicine_count=medicine_count,
-                    stone_count=stone_count,
-                    series=series,
-                    stage=stage,
-                    stage_1=stage_1,
-                    stage_2=stage_2,
-                    stage_3=stage_3,
-                    remain_stage=remain_stage,
-                    client_type=client_type,
-                    account_name=account_name,
-                    annihilation_stage=annihilation_stage,
-                    infrast_mode=infrast_mode,
-                    custom_infrast_path=custom_infrast_path,
-                    custom_infrast_plan_index=custom_infrast_plan_index,
-                    post_action=post_action,
-                    connect_address=connect_address,
-                )
+                maa_update(maa_root)
             except Exception as e:
-                # 配置失败时还原备份
-                if backup_dir and backup_dir.exists():
-                    restore_config_dir(config_dir, backup_dir)
-                return {
-                    "status": "error",
-                    "message": f"配置 MAA 失败: {str(e)}",
-                    "data": {}
-                }
+                pass  # 更新失败不影响后续流程
 
-            # B服协议处理
-            if client_type == "Bilibili":
-                tasks_json_path = Path(maa_path) / MAA_TASKS_JSON
-                if tasks_json_path.exists():
-                    set_bilibili_agreement(tasks_json_path, True)
-
-            # 重置监控状态
-            with self._lock:
-                self._current_task_status = STATUS_RUNNING
-                self._current_logs = []
-                self._latest_time = None
-                self._current_task_type = "启动中"
-                self._task_start_time = datetime.now()
-                self._stop_monitoring = False
-
-            # 启动异步任务执行
-            asyncio.create_task(
-                self._run_maa_task_async(
-                    maa_exe=maa_exe,
-                    maa_path=Path(maa_path),
-                    tasks=tasks,
-                    fight_mode=fight_mode,
-                    max_restart=max_restart,
-                    restart_delay=restart_delay,
-                    backup_dir=backup_dir if restore_after_run else None,
-                    config_dir=config_dir,
-                    client_type=client_type,
-                )
-            )
-
-            return {
-                "status": "success",
-                "message": "MAA 任务已启动",
-                "data": {
-                    "tasks": tasks,
-                    "fight_mode": fight_mode,
-                    "medicine_count": medicine_count,
-                    "stage": stage,
-                    "client_type": client_type,
-                    "account_name": account_name,
-                    "max_restart": max_restart,
-                    "backup_created": backup_dir is not None,
-                }
-            }
+        # 备份配置
+        backup_dir = None
+        if backup_before_run:
+            backup_dir = self._backup_base_dir / f"auto_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            await self._run_blocking(backup_config_dir, config_dir, backup_dir)
 
+        # 加载和修改配置
+        try:
+            self._prepare_config(
+                config_dir=config_dir,
+                tasks=tasks,
+                fight_mode=fight_mode,
+                medicine_count=medicine_count,
+                stone_count=stone_count,
+                series=series,
+                stage=stage,
+                stage_1=stage_1,
+                stage_2=stage_2,
+                stage_3=stage_3,
+                remain_stage=remain_stage,
+                client_type=client_type,
+                account_name=account_name,
+                annihilation_stage=annihilation_stage,
+                infrast_mode=infrast_mode,
+                custom_infrast_path=custom_infrast_path,
+                custom_infrast_plan_index=custom_infrast_plan_index,
+                post_action=post_action,
+                connect_address=connect_address,
+            )
         except Exception as e:
+            # 配置失败时还原备份
+            if backup_dir and backup_dir.exists():
+                await self._run_blocking(restore_config_dir, config_dir, backup_dir)
             return {
                 "status": "error",
-                "message": f"启动 MAA 任务失败: {str(e)}",
+                "message": f"配置 MAA 失败: {str(e)}",
                 "data": {}
             }
 
+        # B服协议处理
+        if client_type == "Bilibili":
+            tasks_json_path = maa_root / MAA_TASKS_JSON
+            if tasks_json_path.exists():
+                set_bilibili_agreement(tasks_json_path, True)
+
+        # 重置监控状态
+        with self._lock:
+            self._state = _TaskState(STATUS_RUNNING, "启动中", (), None, time.monotonic())
+            self._stop_monitoring = False
+        self._running_cache = None
+
+        # 启动异步任务执行
+        asyncio.create_task(
+            self._run_maa_task_async(
+                maa_exe=maa_exe,
+                maa_path=maa_root,
+                tasks=tasks,
+                fight_mode=fight_mode,
+                max_restart=max_restart,
+                restart_delay=restart_delay,
+                backup_dir=backup_dir if restore_after_run else None,
+                config_dir=config_dir,
+                client_type=client_type,
+            )
+        )
+
+        return {
+            "status": "success",
+            "message": "MAA 任务已启动",
+            "data": {
+                "tasks": tasks,
+                "fight_mode": fight_mode,
+                "medicine_count": medicine_count,
+                "stage": stage,
+                "client_type": client_type,
+                "account_name": account_name,
+                "max_restart": max_restart,
+                "backup_created": backup_dir is not None,
+            }
+        }
+
     async def _run_maa_task_async(
         self,
         maa_exe: Path,
@@ -459,29 +609,17 @@ class MAATools:
     ):
         """异步执行 MAA 任务（后台运行）"""
         start_time = datetime.now()
-
-        def callback(logs: List[str], latest_time: datetime, status: str):
-            """日志回调"""
-            with self._lock:
-                self._current_logs = logs
-                self._latest_time = latest_time
-                self._current_task_status = status
-
-                # 解析当前任务类型
-                for task_zh in MAA_TASKS_ZH:
-                    if any(task_zh in log for log in logs[-5:]):
-                        self._current_task_type = task_zh
-                        break
+        log_path = maa_path / MAA_DEBUG_LOG
+        tasks_json_path = maa_path / MAA_TASKS_JSON
 
         try:
             # 启动并监控（含异常重启）
-            log_path = maa_path / MAA_DEBUG_LOG
-            final_status = await asyncio.get_event_loop().run_in_executor(
-                None,
+            final_status = await asyncio.get_running_loop().run_in_executor(
+                self._maa_executor,
                 run_maa_until_done,
                 maa_exe,
                 log_path,
-                callback,
+                self._on_log_update,
                 None,  # log_start_time
                 1.0,  # poll_interval
                 60.0,  # idle_timeout_minutes
@@ -490,12 +628,10 @@ class MAATools:
                 restart_delay,
             )
 
-            with self._lock:
-                self._current_task_status = final_status
+            self._set_status(final_status)
 
         except Exception as e:
-            with self._lock:
-                self._current_task_status = f"执行异常: {str(e)}"
+            self._set_status(f"执行异常: {str(e)}")
             final_status = f"执行异常: {str(e)}"
 
         finally:
@@ -514,15 +650,16 @@ class MAATools:
             )
 
             # 清理 B服协议
-            if client_type == "Bilibili":
-                tasks_json_path = maa_path / MAA_TASKS_JSON
-                if tasks_json_path.exists():
-                    set_bilibili_agreement(tasks_json_path, False)
+            if client_type == "Bilibili" and tasks_json_path.exists():
+                set_bilibili_agreement(tasks_json_path, False)
 
             # 还原配置
             if backup_dir and backup_dir.exists():
-                restore_config_dir(config_dir, backup_dir, remove_backup=True)
+                await self._run_blocking(
+                    restore_config_dir, config_dir, backup_dir, remove_backup=True
+                )
 
+    @_safe_tool_response("启动队列任务失败")
     async def start_maa_queue(
         self,
         queue_items: List[Dict[str, Any]],
@@ -530,71 +667,39 @@ class MAATools:
         restart_delay: float = 2.0,
     ) -> Dict[str, Any]:
         """启动 MAA 队列任务（多账号/多配置循环执行）"""
-        try:
-            if not queue_items:
-                return {
-                    "status": "error",
-                    "message": "队列任务列表不能为空",
-                    "data": {}
-                }
-
-            # 检查 MAA 路径
-            maa_path = get_maa_path()
-            if not maa_path:
-                return {
-                    "status": "error",
-                    "message": "请先使用 set_maa_path 配置 MAA 路径",
-                    "data": {}
-                }
-
-            is_valid, msg = validate_maa_path(maa_path)
-            if not is_valid:
-                return {"status": "error", "message": f"MAA 路径无效: {msg}", "data": {}}
-
-            maa_exe = get_maa_exe_path()
-            if is_maa_running(maa_exe):
-                return {
-                    "status": "error",
-                    "message": "MAA 已在运行中，请先停止当前任务",
-                    "data": {}
-                }
-
-            config_dir = get_maa_config_dir()
-            if not config_dir or not config_dir.exists():
-                return {
-                    "status": "error",
-                    "message": "MAA 配置目录不存在，请先运行一次 MAA",
-                    "data": {}
-                }
-
-            # 启动异步队列任务
-            asyncio.create_task(
-                self._run_maa_queue_async(
-                    queue_items=queue_items,
-                    maa_exe=maa_exe,
-                    maa_path=Path(maa_path),
-                    config_dir=config_dir,
-                    max_restart=max_restart,
-                    restart_delay=restart_delay,
-                )
-            )
-
-            return {
-                "status": "success",
-                "message": f"MAA 队列任务已启动，共 {len(queue_items)} 项",
-                "data": {
-                    "queue_size": len(queue_items),
-                    "max_restart": max_restart,
-                }
-            }
-
-        except Exception as e:
+        if not queue_items:
             return {
                 "status": "error",
-                "message": f"启动队列任务失败: {str(e)}",
+                "message": "队列任务列表不能为空",
                 "data": {}
             }
 
+        # 检查 MAA 路径、运行状态与配置目录
+        error, maa_path, maa_exe, config_dir = await self._precheck_ready()
+        if error:
+            return error
+
+        # 启动异步队列任务
+        asyncio.create_task(
+            self._run_maa_queue_async(
+                queue_items=queue_items,
+                maa_exe=maa_exe,
+                maa_path=Path(maa_path),
+                config_dir=config_dir,
+                max_restart=max_restart,
+                restart_delay=restart_delay,
+            )
+        )
+
+        return {
+            "status": "success",
+            "message": f"MAA 队列任务已启动，共 {len(queue_items)} 项",
+            "data": {
+                "queue_size": len(queue_items),
+                "max_restart": max_restart,
+            }
+        }
+
     async def _run_maa_queue_async(
         self,
         queue_items: List[Dict[str, Any]],
@@ -606,17 +711,20 @@ class MAATools:
     ):
         """异步执行队列任务"""
         start_time = datetime.now()
+        log_path = maa_path / MAA_DEBUG_LOG
+        tasks_json_path = maa_path / MAA_TASKS_JSON
+
+        # B服协议在连续的 B服项之间保持开启，切到其他客户端或队列结束时才关闭，
+        # 避免每项都改写一次 tasks.json
+        bilibili_enabled = False
 
-        def callback(logs: List[str], latest_time: datetime, status: str):
-            """日志回调"""
-            with self._lock:
-                self._current_logs = logs
-                self._latest_time = latest_time
-                self._current_task_status = status
-                for task_zh in MAA_TASKS_ZH:
-                    if any(task_zh in log for log in logs[-5:]):
-                        self._current_task_type = task_zh
-                        break
+        def set_agreement(enabled: bool):
+            nonlocal bilibili_enabled
+            if enabled == bilibili_enabled:
+                return
+            if tasks_json_path.exists():
+                set_bilibili_agreement(tasks_json_path, enabled)
+            bilibili_enabled = enabled
 
         def prepare_item(item: Dict[str, Any]):
             """准备单项配置"""
@@ -643,30 +751,22 @@ class MAATools:
             )
 
             # B服协议
-            if item.get("client_type") == "Bilibili":
-                tasks_json_path = maa_path / MAA_TASKS_JSON
-                if tasks_json_path.exists():
-                    set_bilibili_agreement(tasks_json_path, True)
+            set_agreement(item.get("client_type") == "Bilibili")
 
         def cleanup_item(item: Dict[str, Any]):
-            """清理单项"""
-            if item.get("client_type") == "Bilibili":
-                tasks_json_path = maa_path / MAA_TASKS_JSON
-                if tasks_json_path.exists():
-                    set_bilibili_agreement(tasks_json_path, False)
+            """清理单项（B服协议由下一项或队列结束时统一处理）"""
 
         try:
             # 执行队列
-            log_path = maa_path / MAA_DEBUG_LOG
-            results = await asyncio.get_event_loop().run_in_executor(
-                None,
+            results = await asyncio.get_running_loop().run_in_executor(
+                self._maa_executor,
                 run_queue,
                 queue_items,
                 prepare_item,
                 cleanup_item,
                 maa_exe,
                 log_path,
-                callback,
+                self._on_log_update,
                 None,  # log_start_time
                 1.0,  # poll_interval
                 60.0,  # idle_timeout_minutes
@@ -681,9 +781,11 @@ class MAATools:
             final_status = f"队列执行异常: {str(e)}"
 
         finally:
+            # 关闭队列末尾仍开启的 B服协议
+            set_agreement(False)
+
             end_time = datetime.now()
-            with self._lock:
-                self._current_task_status = final_status
+            self._set_status(final_status)
 
             self._task_history.add_record(
                 task_type="队列任务",
@@ -693,308 +795,331 @@ class MAATools:
                 details={"queue_size": len(queue_items)},
             )
 
+    @_safe_tool_response("获取任务进度失败")
     async def get_task_progress(self) -> Dict[str, Any]:
         """获取任务进度"""
-        try:
-            with self._lock:
-                status = self._current_task_status
-                task_type = self._current_task_type
-                logs = self._current_logs[-20:] if self._current_logs else []
-                latest_time = self._latest_time
-                task_start_time = self._task_start_time
-
-            # 检查 MAA 是否在运行
-            maa_exe = get_maa_exe_path()
-            running = is_maa_running(maa_exe) if maa_exe else False
-
-            # 计算运行时长
-            duration = None
-            if task_start_time:
-                duration = (datetime.now() - task_start_time).total_seconds()
-
-            return {
-                "status": "success",
-                "message": "任务进度获取成功",
-                "data": {
-                    "task_status": status,
-                    "is_running": running,
-                    "current_task": task_type,
-                    "latest_time": latest_time.strftime("%Y-%m-%d %H:%M:%S") if latest_time else None,
-                    "duration_seconds": duration,
-                    "recent_logs": logs,
-                    "is_finished": is_terminal_status(status),
-                    "is_success": status == STATUS_SUCCESS,
-                }
+        state = self._state
+        status = state.status
+        task_type = state.task_type
+        logs = list(state.logs)
+        latest_time = state.latest_time
+        start_monotonic = state.start_monotonic
+
+        # 检查 MAA 是否在运行
+        maa_exe = _cached_maa_exe()
+        running = await self._check_running(maa_exe)
+
+        # 计算运行时长
+        duration = None
+        if start_monotonic is not None:
+            duration = time.monotonic() - start_monotonic
+
+        return {
+            "status": "success",
+            "message": "任务进度获取成功",
+            "data": {
+                "task_status": status,
+                "is_running": running,
+                "current_task": task_type,
+                "latest_time": latest_time.strftime("%Y-%m-%d %H:%M:%S") if latest_time else None,
+                "duration_seconds": duration,
+                "recent_logs": logs,
+                "is_finished": is_terminal_status(status),
+                "is_success": status == STATUS_SUCCESS,
             }
+        }
 
-        except Exception as e:
+    @_safe_tool_response("停止 MAA 失败")
+    async def stop_maa(self) -> Dict[str, Any]:
+        """停止 MAA"""
+        maa_exe = _cached_maa_exe()
+        if not maa_exe:
             return {
                 "status": "error",
-                "message": f"获取任务进度失败: {str(e)}",
+                "message": "MAA 未配置",
                 "data": {}
             }
 
-    async def stop_maa(self) -> Dict[str, Any]:
-        """停止 MAA"""
-        try:
-            maa_exe = get_maa_exe_path()
-            if not maa_exe:
-                return {
-                    "status": "error",
-                    "message": "MAA 未配置",
-                    "data": {}
-                }
-
-            if not is_maa_running(maa_exe):
-                return {
-                    "status": "success",
-                    "message": "MAA 未在运行",
-                    "data": {"was_running": False}
-                }
-
-            # 停止监控
-            self._stop_monitoring = True
+        if not is_maa_running(maa_exe):
+            return {
+                "status": "success",
+                "message": "MAA 未在运行",
+                "data": {"was_running": False}
+            }
 
-            # 结束进程
-            success = kill_maa(maa_exe)
+        # 停止监控
+        self._stop_monitoring = True
 
-            if success:
-                with self._lock:
-                    self._current_task_status = "已手动停止"
-                    self._current_task_type = "已停止"
+        # 结束进程
+        success = kill_maa(maa_exe)
+        self._running_cache = None
 
-                return {
-                    "status": "success",
-                    "message": "MAA 已停止",
-                    "data": {"was_running": True}
-                }
-            else:
-                return {
-                    "status": "error",
-                    "message": "停止 MAA 失败",
-                    "data": {}
-                }
+        if success:
+            self._set_status("已手动停止", task_type="已停止")
 
-        except Exception as e:
+            return {
+                "status": "success",
+                "message": "MAA 已停止",
+                "data": {"was_running": True}
+            }
+        else:
             return {
                 "status": "error",
-                "message": f"停止 MAA 失败: {str(e)}",
+                "message": "停止 MAA 失败",
                 "data": {}
             }
 
     # ==================== MAA 维护 ====================
 
+    @_safe_tool_response("检查/执行更新失败")
     async def update_maa(self) -> Dict[str, Any]:
         """检查并执行 MAA 更新"""
-        try:
-            maa_path = get_maa_path()
-            if not maa_path:
-                return {
-                    "status": "error",
-                    "message": "请先配置 MAA 路径",
-                    "data": {}
-                }
-
-            # 检查是否有更新包
-            maa_root = Path(maa_path)
-            gui_json = maa_root / "config" / "gui.json"
-            if not gui_json.exists():
-                return {
-                    "status": "error",
-                    "message": "MAA 配置文件不存在",
-                    "data": {}
-                }
-
-            # 读取更新包信息
-            with open(gui_json, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            update_package = data.get("Global", {}).get("VersionUpdate.package", "")
-            if not update_package:
-                return {
-                    "status": "success",
-                    "message": "没有可用的更新包",
-                    "data": {"has_update": False}
-                }
-
-            update_package_path = maa_root / update_package
-            if not update_package_path.exists():
-                return {
-                    "status": "success",
-                    "message": "更新包文件不存在",
-                    "data": {"has_update": False, "package": update_package}
-                }
-
-            # 执行更新
-            success = maa_update(maa_root)
-
-            if success:
-                return {
-                    "status": "success",
-                    "message": "MAA 更新执行成功",
-                    "data": {
-                        "has_update": True,
-                        "package": update_package,
-                        "updated": True,
-                    }
-                }
-            else:
-                return {
-                    "status": "error",
-                    "message": "MAA 更新执行失败",
-                    "data": {
-                        "has_update": True,
-                        "package": update_package,
-                        "updated": False,
-                    }
-                }
+        maa_path = get_maa_path()
+        if not maa_path:
+            return {
+                "status": "error",
+                "message": "请先配置 MAA 路径",
+                "data": {}
+            }
 
-        except Exception as e:
+        # 检查是否有更新包
+        maa_root = Path(maa_path)
+        gui_json = maa_root / "config" / "gui.json"
+        if not gui_json.exists():
             return {
                 "status": "error",
-                "message": f"检查/执行更新失败: {str(e)}",
+                "message": "MAA 配置文件不存在",
                 "data": {}
             }
 
-    # ==================== 配置备份还原 ====================
+        # 读取更新包信息
+        update_package = _read_update_package(gui_json)
+        if not update_package:
+            return {
+                "status": "success",
+                "message": "没有可用的更新包",
+                "data": {"has_update": False}
+            }
 
-    async def backup_config(self, backup_name: str = "default") -> Dict[str, Any]:
-        """备份 MAA 配置"""
-        try:
-            config_dir = get_maa_config_dir()
-            if not config_dir or not config_dir.exists():
-                return {
-                    "status": "error",
-                    "message": "MAA 配置目录不存在",
-                    "data": {}
-                }
+        update_package_path = maa_root / update_package
+        if not update_package_path.exists():
+            return {
+                "status": "success",
+                "message": "更新包文件不存在",
+                "data": {"has_update": False, "package": update_package}
+            }
 
-            backup_dir = self._backup_base_dir / backup_name
-            backup_config_dir(config_dir, backup_dir)
+        # 执行更新
+        success = maa_update(maa_root)
 
+        if success:
             return {
                 "status": "success",
-                "message": f"配置备份成功: {backup_name}",
+                "message": "MAA 更新执行成功",
+                "data": {
+                    "has_update": True,
+                    "package": update_package,
+                    "updated": True,
+                }
+            }
+        else:
+            return {
+                "status": "error",
+                "message": "MAA 更新执行失败",
                 "data": {
-                    "backup_name": backup_name,
-                    "backup_path": str(backup_dir),
+                    "has_update": True,
+                    "package": update_package,
+                    "updated": False,
                 }
             }
 
-        except Exception as e:
+    # ==================== 配置备份还原 ====================
+
+    @_safe_tool_response("备份配置失败")
+    async def backup_config(self, backup_name: str = "default") -> Dict[str, Any]:
+        """备份 MAA 配置"""
+        config_dir = get_maa_config_dir()
+        if not config_dir or not config_dir.exists():
             return {
                 "status": "error",
-                "message": f"备份配置失败: {str(e)}",
+                "message": "MAA 配置目录不存在",
                 "data": {}
             }
 
-    async def restore_config(self, backup_name: str = "default") -> Dict[str, Any]:
-        """从备份还原 MAA 配置"""
-        try:
-            config_dir = get_maa_config_dir()
-            if not config_dir or not config_dir.exists():
-                return {
-                    "status": "error",
-                    "message": "MAA 配置目录不存在",
-                    "data": {}
-                }
+        backup_dir = self._backup_base_dir / backup_name
+        await self._run_blocking(backup_config_dir, config_dir, backup_dir)
 
-            backup_dir = self._backup_base_dir / backup_name
-            if not backup_dir.exists():
-                return {
-                    "status": "error",
-                    "message": f"备份不存在: {backup_name}",
-                    "data": {}
-                }
-
-            restore_config_dir(config_dir, backup_dir, remove_backup=False)
+        return {
+            "status": "success",
+            "message": f"配置备份成功: {backup_name}",
+            "data": {
+                "backup_name": backup_name,
+                "backup_path": str(backup_dir),
+            }
+        }
 
+    @_safe_tool_response("还原配置失败")
+    async def restore_config(self, backup_name: str = "default") -> Dict[str, Any]:
+        """从备份还原 MAA 配置"""
+        config_dir = get_maa_config_dir()
+        if not config_dir or not config_dir.exists():
             return {
-                "status": "success",
-                "message": f"配置还原成功: {backup_name}",
-                "data": {
-                    "backup_name": backup_name,
-                    "backup_path": str(backup_dir),
-                }
+                "status": "error",
+                "message": "MAA 配置目录不存在",
+                "data": {}
             }
 
-        except Exception as e:
+        backup_dir = self._backup_base_dir / backup_name
+        if not backup_dir.exists():
             return {
                 "status": "error",
-                "message": f"还原配置失败: {str(e)}",
+                "message": f"备份不存在: {backup_name}",
                 "data": {}
             }
 
+        await self._run_blocking(
+            restore_config_dir, config_dir, backup_dir, remove_backup=False
+        )
+
+        return {
+            "status": "success",
+            "message": f"配置还原成功: {backup_name}",
+            "data": {
+                "backup_name": backup_name,
+                "backup_path": str(backup_dir),
+            }
+        }
+
     # ==================== 信息查询 ====================
 
     async def list_available_tasks(self) -> Dict[str, Any]:
         """列出所有可用的任务类型"""
-        try:
-            tasks_info = []
-            for en_task, zh_task in zip(MAA_TASKS, MAA_TASKS_ZH):
-                tasks_info.append({
-                    "task_type": en_task,
-                    "display_name": zh_task,
-                })
+        # 外层与 data 各复制一层，调用方修改返回值不会影响共享的常量
+        return {**_LIST_TASKS_PAYLOAD, "data": dict(_LIST_TASKS_PAYLOAD["data"])}
 
-            return {
-                "status": "success",
-                "message": "任务列表获取成功",
-                "data": {
-                    "tasks": tasks_info,
-                    "fight_modes": [
-                        {"value": "Routine", "name": "常规刷关"},
-                        {"value": "Annihilation", "name": "剿灭作战"},
-                    ],
-                    "client_types": [
-                        {"value": "Official", "name": "官服"},
-                        {"value": "Bilibili", "name": "B服"},
-                        {"value": "YoStarEN", "name": "国际服英文"},
-                        {"value": "YoStarJP", "name": "日服"},
-                        {"value": "YoStarKR", "name": "韩服"},
-                        {"value": "txwy", "name": "繁中服"},
-                    ],
-                    "infrast_modes": [
-                        {"value": "Normal", "name": "普通模式"},
-                        {"value": "Custom", "name": "自定义模式"},
-                    ],
-                    "post_actions": [
-                        {"value": "NoAction", "name": "无动作"},
-                        {"value": "ExitGame", "name": "退出游戏"},
-                        {"value": "ExitEmulator", "name": "退出模拟器"},
-                    ],
-                }
+    @_safe_tool_response("获取任务历史失败")
+    async def get_task_history(self, limit: int = 10) -> Dict[str, Any]:
+        """获取任务历史记录"""
+        history = self._task_history.get_history(limit)
+
+        return {
+            "status": "success",
+            "message": "任务历史获取成功",
+            "data": {
+                "history": history,
+                "total": len(history),
             }
+        }
 
-        except Exception as e:
-            return {
-                "status": "error",
-                "message": f"获取任务列表失败: {str(e)}",
-                "data": {}
-            }
+    # ==================== 内部辅助方法 ====================
 
-    async def get_task_history(self, limit: int = 10) -> Dict[str, Any]:
-        """获取任务历史记录"""
+    def _on_log_update(self, logs: List[str], latest_time: datetime, status: str):
+        """日志回调（在执行器线程中调用）"""
+        # 解析当前任务类型
+        task_zh = _detect_task_type(logs)
+        # 只保留定长尾部，不持有执行器线程仍在追加的日志列表
+        recent = tuple(logs[-_RECENT_LOG_LIMIT:])
+        with self._lock:
+            self._state = self._state._replace(
+                status=status,
+                task_type=task_zh or self._state.task_type,
+                logs=recent,
+                latest_time=latest_time,
+            )
+
+    def _set_status(self, status: str, task_type: Optional[str] = None):
+        with self._lock:
+            self._state = self._state._replace(
+                status=status, task_type=task_type or self._state.task_type
+            )
+
+    def _prune_old_backups(self, keep: int = _AUTO_BACKUP_KEEP):
+        """只保留最新的 keep 个自动备份目录"""
         try:
-            history = self._task_history.get_history(limit)
+            with os.scandir(self._backup_base_dir) as it:
+                names = sorted(
+                    e.name for e in it
+                    if e.name.startswith("auto_backup_") and e.is_dir(follow_symlinks=False)
+                )
+        except OSError:
+            return
+        # 目录名中的时间戳可直接按字典序排序
+        for name in names[:max(len(names) - keep, 0)]:
+            shutil.rmtree(self._backup_base_dir / name, ignore_errors=True)
 
+    async def _precheck_ready(
+        self,
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str], Optional[Path], Optional[Path]]:
+        """
+        启动任务前的公共检查：路径已配置且有效、MAA 未在运行、配置目录存在
+
+        返回 (错误响应, maa_path, maa_exe, config_dir)，通过时错误响应为 None。
+        路径与配置目录的校验结果短时间内复用，运行状态每次都重新检测。
+        """
+        maa_path = get_maa_path()
+        if not maa_path:
             return {
-                "status": "success",
-                "message": "任务历史获取成功",
-                "data": {
-                    "history": history,
-                    "total": len(history),
-                }
-            }
+                "status": "error",
+                "message": "请先使用 set_maa_path 配置 MAA 路径",
+                "data": {}
+            }, None, None, None
 
-        except Exception as e:
+        cached = self._precheck_cache
+        if cached and cached[0] == maa_path and time.monotonic() - cached[1] < _PRECHECK_TTL:
+            maa_exe, config_dir = cached[2], cached[3]
+        else:
+            is_valid, msg = validate_maa_path(maa_path)
+            if not is_valid:
+                return {"status": "error", "message": f"MAA 路径无效: {msg}", "data": {}}, None, None, None
+            maa_exe = get_maa_exe_path()
+            config_dir = get_maa_config_dir()
+            if not config_dir or not config_dir.exists():
+                return {
+                    "status": "error",
+                    "message": "MAA 配置目录不存在，请先运行一次 MAA",
+                    "data": {}
+                }, None, None, None
+            self._precheck_cache = (maa_path, time.monotonic(), maa_exe, config_dir)
+
+        if await self._run_blocking(is_maa_running, maa_exe):
             return {
                 "status": "error",
-                "message": f"获取任务历史失败: {str(e)}",
+                "message": "MAA 已在运行中，请先停止当前任务",
                 "data": {}
-            }
+            }, None, None, None
+        return None, maa_path, maa_exe, config_dir
+
+    @staticmethod
+    async def _run_blocking(func, *args, **kwargs):
+        """在默认线程池中执行阻塞的文件操作，避免卡住事件循环"""
+        return await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(func, *args, **kwargs)
+        )
 
-    # ==================== 内部辅助方法 ====================
+    def _get_static_status(self, maa_path: str, maa_exe: Optional[Path]) -> Dict[str, Any]:
+        """get_maa_status 中不随轮询变化的字段，路径不变时不再重复 resolve"""
+        cached = self._status_static
+        if cached is None or cached[0] != maa_path or cached[1] != maa_exe:
+            static = {
+                "configured": True,
+                "valid": True,
+                "maa_path": str(Path(maa_path).resolve()),
+                "maa_exe": str(maa_exe),
+            }
+            cached = (maa_path, maa_exe, static)
+            self._status_static = cached
+        return cached[2]
+
+    async def _check_running(self, maa_exe: Optional[Path]) -> bool:
+        """在线程池中检测 MAA 进程，短时间内的重复查询复用上次结果"""
+        if not maa_exe:
+            return False
+        cached = self._running_cache
+        if cached and cached[0] == maa_exe and time.monotonic() - cached[1] < _RUNNING_CACHE_TTL:
+            return cached[2]
+        running = await asyncio.get_running_loop().run_in_executor(None, is_maa_running, maa_exe)
+        self._running_cache = (maa_exe, time.monotonic(), running)
+        return running
 
     def _prepare_config(
         self,
@@ -1018,7 +1143,22 @@ class MAATools:
         post_action: str,
         connect_address: Optional[str],
     ):
-        """准备 MAA 配置"""
+        """
+        准备 MAA 配置
+
+        参数与上次写入相同且配置文件未被改动时跳过读写
+        """
+        addr = connect_address or _cached_connect_address() or ""
+        key = (
+            tuple(sorted(tasks.items())), fight_mode, medicine_count, stone_count,
+            series, stage, stage_1, stage_2, stage_3, remain_stage, client_type,
+            account_name, annihilation_stage, infrast_mode, custom_infrast_path,
+            custom_infrast_plan_index, post_action, addr,
+        )
+        cached = self._prepare_cache.get(config_dir)
+        if cached and cached[0] == key and cached[1] == _config_files_stamp(config_dir):
+            return
+
         # 加载配置
         gui_set, gui_new_set = load_maa_config(config_dir)
 
@@ -1036,7 +1176,6 @@ class MAATools:
         )
 
         # 设置连接地址
-        addr = connect_address or get_saved_connect_address() or ""
         if addr:
             set_config_connect_address(gui_set, addr)
 
@@ -1052,17 +1191,21 @@ class MAATools:
         set_post_actions(gui_set, post_action)
 
         # 构建任务队列
-        plan_data = {
-            "MedicineNumb": medicine_count,
-            "SeriesNumb": series,
-            "Stage": stage or "-",
-            "Stage_1": stage_1 or "-",
-            "Stage_2": stage_2 or "-",
-            "Stage_3": stage_3 or "-",
-            "Stage_Remain": remain_stage or "-",
+        # 只覆盖非空字段，其余沿用默认计划
+        plan_data = _PLAN_DATA_DEFAULT | {
+            k: v for k, v in (
+                ("MedicineNumb", medicine_count),
+                ("SeriesNumb", series),
+                ("Stage", stage),
+                ("Stage_1", stage_1),
+                ("Stage_2", stage_2),
+                ("Stage_3", stage_3),
+                ("Stage_Remain", remain_stage),
+            ) if v
         }
 
-        task_enabled = {task: tasks.get(task, False) for task in MAA_TASKS}
+        # 未指定的任务默认关闭，忽略 MAA_TASKS 以外的键，顺序与 MAA_TASKS 一致
+        task_enabled = _ALL_TASKS_DISABLED | {t: tasks[t] for t in tasks.keys() & _MAA_TASKS_SET}
 
         build_task_queue_from_tasks(
             gui_new_set,
@@ -1081,3 +1224,4 @@ class MAATools:
 
         # 保存配置
         save_maa_config(config_dir, gui_set, gui_new_set)
+        self._prepare_cache[config_dir] = (key, _config_files_stamp(config_dir))
@@ -16,7 +16,7 @@ TASK_PARAM_SCHEMAS: Dict[str, Dict[str, Any]] = {
         "params": {
             "client_type": {
                 "type": "enum",
-                "options": ["Official", "Bilibili"],
+                "options": ("Official", "Bilibili"),
                 "default": "Official",
                 "label": "客户端类型",
             },
@@ -32,7 +32,7 @@ TASK_PARAM_SCHEMAS: Dict[str, Dict[str, Any]] = {
         "params": {
             "fight_mode": {
                 "type": "enum",
-                "options": ["Routine", "Annihilation"],
+                "options": ("Routine", "Annihilation"),
                 "default": "Routine",
                 "label": "作战模式",
             },
@@ -173,13 +173,13 @@ TASK_PARAM_SCHEMAS: Dict[str, Dict[str, Any]] = {
         "params": {
             "infrast_mode": {
                 "type": "enum",
-                "options": ["Normal", "Custom"],
+                "options": ("Normal", "Custom"),
                 "default": "Normal",
                 "label": "模式",
             },
             "infrast_uses_of_drones": {
                 "type": "enum",
-                "options": ["Money", "Combat", "Power"],
+                "options": ("Money", "Combat", "Power"),
                 "default": "Money",
                 "label": "无人机用途",
             },
@@ -320,13 +320,13 @@ TASK_PARAM_SCHEMAS: Dict[str, Dict[str, Any]] = {
         "params": {
             "roguelike_theme": {
                 "type": "enum",
-                "options": ["Phantom", "Mizuki", "Sami", "Sarkaz", "JieGarden"],
+                "options": ("Phantom", "Mizuki", "Sami", "Sarkaz", "JieGarden"),
                 "default": "JieGarden",
                 "label": "主题",
             },
             "roguelike_mode": {
                 "type": "enum",
-                "options": ["Exp", "Collectible", "Investment"],
+                "options": ("Exp", "Collectible", "Investment"),
                 "default": "Exp",
                 "label": "模式",
             },
@@ -447,7 +447,7 @@ TASK_PARAM_SCHEMAS: Dict[str, Dict[str, Any]] = {
         "params": {
             "reclamation_theme": {
                 "type": "enum",
-                "options": ["Tales", "Reclamation2"],
+                "options": ("Tales", "Reclamation2"),
                 "default": "Tales",
                 "label": "主题",
             },
@@ -493,17 +493,21 @@ def get_task_catalog(last_params: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
         last_params: 从 config.get_all_last_params() 获取的上次参数
 
     Returns:
-        带 last_used 标注的完整任务目录
+        带 last_used 标注的完整任务目录（未附加 last_used 的参数定义与 schema 共享，调用方不应修改）
     """
     catalog = {}
     for task_type, schema in TASK_PARAM_SCHEMAS.items():
-        task_last = last_params.get(task_type, {})
+        task_last = last_params.get(task_type)
+        if not task_last:
+            catalog[task_type] = {"name": schema["name"], "params": dict(schema["params"])}
+            continue
         params_with_last = {}
         for param_name, param_def in schema["params"].items():
-            entry = dict(param_def)  # copy
+            # 只有需要附加 last_used 时才复制，其余直接共享 schema 定义
             if param_name in task_last:
-                entry["last_used"] = task_last[param_name]
-            params_with_last[param_name] = entry
+                params_with_last[param_name] = {**param_def, "last_used": task_last[param_name]}
+            else:
+                params_with_last[param_name] = param_def
         catalog[task_type] = {
             "name": schema["name"],
             "params": params_with_last,
@@ -1,6 +1,7 @@
 """MAA 任务预设 - 常用任务的快捷配置模板"""
 
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
 
 # 任务预设模板
 TASK_PRESETS = {
@@ -325,6 +326,41 @@ TASK_PRESETS = {
 }
 
 
+def _resolve_aliases() -> Dict[str, str]:
+    """把别名（含多级别名）展开为最终的真实预设名，悬空或循环的别名被忽略"""
+    resolved = {}
+    for alias, target in TASK_PRESETS.items():
+        if not isinstance(target, str):
+            continue
+        seen = {alias}
+        while target not in seen:
+            seen.add(target)
+            target_value = TASK_PRESETS.get(target)
+            if not isinstance(target_value, str):
+                break
+            target = target_value
+        if isinstance(TASK_PRESETS.get(target), dict):
+            resolved[alias] = target
+    return resolved
+
+
+# 导入时预先拆分：真实预设（带 name 的模板）与 别名 -> 真实预设名
+_REAL_PRESETS: Dict[str, Dict[str, Any]] = {
+    key: value for key, value in TASK_PRESETS.items()
+    if isinstance(value, dict) and "name" in value
+}
+_ALIAS_TO_REAL: Dict[str, str] = _resolve_aliases()
+# 只读视图，名称与别名都直接映射到同一个视图
+_PRESET_VIEWS: Dict[str, Mapping[str, Any]] = {
+    key: MappingProxyType(value) for key, value in _REAL_PRESETS.items()
+}
+_PRESET_VIEWS.update((alias, _PRESET_VIEWS[real]) for alias, real in _ALIAS_TO_REAL.items())
+# get_preset_suggestions 用的 (别名, 直接目标) 列表，保持 TASK_PRESETS 中的顺序
+_ALIAS_PAIRS: Tuple[Tuple[str, str], ...] = tuple(
+    (key, value) for key, value in TASK_PRESETS.items() if isinstance(value, str)
+)
+
+
 def get_preset(preset_name: str) -> Optional[Dict[str, Any]]:
     """
     获取预设任务配置
@@ -332,15 +368,22 @@ def get_preset(preset_name: str) -> Optional[Dict[str, Any]]:
     :param preset_name: 预设名称或别名（如 "daily_full", "收基建"）
     :return: 任务配置字典，如果预设不存在则返回 None
     """
-    # 如果是别名，解析为真实预设名
-    if preset_name in TASK_PRESETS:
-        value = TASK_PRESETS[preset_name]
-        if isinstance(value, str):
-            # 这是别名，递归获取
-            return get_preset(value)
-        # 这是真实预设，返回副本
-        return value.copy()
-    return None
+    real_name = _ALIAS_TO_REAL.get(preset_name, preset_name)
+    preset = _REAL_PRESETS.get(real_name)
+    if preset is None:
+        return None
+    # 返回副本（含内层 tasks），调用方修改不影响模板
+    return {**preset, "tasks": dict(preset["tasks"])}
+
+
+def get_preset_view(preset_name: str) -> Optional[Mapping[str, Any]]:
+    """
+    获取预设模板的只读视图（不复制，适合只做判断或读取的场景）
+
+    :param preset_name: 预设名称或别名
+    :return: 只读视图，如果预设不存在则返回 None（内层 tasks 为共享对象，不应修改）
+    """
+    return _PRESET_VIEWS.get(preset_name)
 
 
 def list_presets() -> Dict[str, Dict[str, str]]:
@@ -349,15 +392,10 @@ def list_presets() -> Dict[str, Dict[str, str]]:
 
     :return: 预设列表，格式为 {preset_id: {name, description}}
     """
-    presets = {}
-    for key, value in TASK_PRESETS.items():
-        # 只包含真实预设，不包含别名
-        if isinstance(value, dict) and "name" in value:
-            presets[key] = {
-                "name": value["name"],
-                "description": value["description"],
-            }
-    return presets
+    return {
+        key: {"name": value["name"], "description": value["description"]}
+        for key, value in _REAL_PRESETS.items()
+    }
 
 
 def merge_preset_with_params(
@@ -371,18 +409,10 @@ def merge_preset_with_params(
     :param custom_params: 自定义参数（会覆盖预设）
     :return: 合并后的配置
     """
-    config = preset.copy()
-
-    # 合并 tasks 字典
+    # 其他参数直接覆盖；tasks 字典按键合并。不修改 preset 与 custom_params
+    config = {**preset, **custom_params}
     if "tasks" in custom_params:
-        if "tasks" not in config:
-            config["tasks"] = {}
-        config["tasks"].update(custom_params["tasks"])
-        del custom_params["tasks"]
-
-    # 合并其他参数
-    config.update(custom_params)
-
+        config["tasks"] = {**preset.get("tasks", {}), **custom_params["tasks"]}
     return config
 
 
@@ -394,15 +424,8 @@ def get_preset_suggestions(input_text: str) -> list[str]:
     :return: 建议的预设名称列表
     """
     text_lower = input_text.lower()
-    suggestions = []
-
-    # 检查所有别名
-    for alias in TASK_PRESETS.keys():
-        if isinstance(TASK_PRESETS[alias], str):  # 这是别名
-            if alias in text_lower or text_lower in alias:
-                # 找到真实预设名
-                real_preset = TASK_PRESETS[alias]
-                if real_preset not in suggestions:
-                    suggestions.append(real_preset)
-
-    return suggestions
+    # 按别名顺序去重
+    return list(dict.fromkeys(
+        real_preset for alias, real_preset in _ALIAS_PAIRS
+        if alias in text_lower or text_lower in alias
+    ))
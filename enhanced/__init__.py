@@ -1,27 +1,32 @@
 """v5.0 增强功能模块"""
 
-from .process_manager import EnhancedProcessManager, ProcessRunner
-from .log_monitor import EnhancedLogMonitor
-from .emulator_manager import (
-    EmulatorManager,
-    EmulatorInfo,
-    BaseEmulator,
-    LDPlayerEmulator,
-    MuMuEmulator,
-    BlueStacksEmulator,
-    NoxEmulator,
-    GeneralEmulator,
-    DeviceStatus,
-)
-from .executor import (
-    EnhancedMAAExecutor,
-    MAATaskConfig,
-    MAAExecutionResult,
-)
-from .adb_discovery import AdbDiscovery, DiscoveredDevice
-from .notification import TaskNotifier
-from .scheduler import TaskScheduler
-from .script_profiles import ScriptProfileManager, ScriptProfile
+import importlib
+
+# 导出名 -> 所在子模块；首次访问时才导入子模块（PEP 562），
+# 只用到 AdbDiscovery 等少数组件时不必加载全部依赖
+_LAZY_EXPORTS = {
+    'EnhancedProcessManager': 'process_manager',
+    'ProcessRunner': 'process_manager',
+    'EnhancedLogMonitor': 'log_monitor',
+    'EmulatorManager': 'emulator_manager',
+    'EmulatorInfo': 'emulator_manager',
+    'BaseEmulator': 'emulator_manager',
+    'LDPlayerEmulator': 'emulator_manager',
+    'MuMuEmulator': 'emulator_manager',
+    'BlueStacksEmulator': 'emulator_manager',
+    'NoxEmulator': 'emulator_manager',
+    'GeneralEmulator': 'emulator_manager',
+    'DeviceStatus': 'emulator_manager',
+    'EnhancedMAAExecutor': 'executor',
+    'MAATaskConfig': 'executor',
+    'MAAExecutionResult': 'executor',
+    'AdbDiscovery': 'adb_discovery',
+    'DiscoveredDevice': 'adb_discovery',
+    'TaskNotifier': 'notification',
+    'TaskScheduler': 'scheduler',
+    'ScriptProfileManager': 'script_profiles',
+    'ScriptProfile': 'script_profiles',
+}
 
 __all__ = [
     'EnhancedProcessManager',
@@ -46,3 +51,17 @@ __all__ = [
     'ScriptProfileManager',
     'ScriptProfile',
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # 缓存到模块字典，之后的访问不再经过 __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -4,13 +4,28 @@
 支持 MuMu / LDPlayer / BlueStacks / Nox(夜神) / MEmu(逍遥)。
 """
 
+import functools
 import json
 import logging
+import os
 import shutil
 import subprocess
-from dataclasses import dataclass, field
+import time
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import psutil
+    _HAS_PSUTIL = True
+except ImportError:
+    _HAS_PSUTIL = False
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
 
 logger = logging.getLogger(__name__)
 
@@ -127,6 +142,67 @@ _EMULATOR_DEFS: List[_EmulatorDef] = [
     ),
 ]
 
+# MuMu 各进程变体，数值越小越优先提供 ADB 路径
+_MUMU_PRIORITY = {"mumu_v5": 0, "mumu": 1, "mumu_service": 2}
+
+# 无管理工具可查询的模拟器使用默认 ADB 地址
+_BLUESTACKS_SERIALS = ("127.0.0.1:5555", "127.0.0.1:5556", "127.0.0.1:5565", "127.0.0.1:5575")
+_NOX_DEFAULT_SERIAL = "127.0.0.1:62001"    # 夜神: 默认端口 62001, 多开 +2
+_MEMU_DEFAULT_SERIAL = "127.0.0.1:21503"   # 逍遥: 默认端口 21503, 多开 +10
+
+# (小写关键字, 定义)，按 _EMULATOR_DEFS 顺序匹配
+_EMULATOR_KEYWORDS: List[Tuple[str, _EmulatorDef]] = [
+    (emu_def.keyword.lower(), emu_def) for emu_def in _EMULATOR_DEFS if emu_def.keyword
+]
+
+
+def _parse_json_output(raw: bytes) -> Any:
+    """解析子进程输出的 JSON（优先 orjson 直接解析 bytes，非 UTF-8 输出回退到宽松解码）"""
+    if _HAS_ORJSON:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw.decode("utf-8", errors="ignore").strip())
+
+
+# 管理工具设备列表的复用时长（秒），连续的 discover 调用不重复启动子进程
+_DEVICE_LIST_TTL = 2.0
+
+# manager_path -> (获取时间, 设备列表)
+_mumu_devices_cache: Dict[str, Tuple[float, List[DiscoveredDevice]]] = {}
+_ldplayer_devices_cache: Dict[str, Tuple[float, List[DiscoveredDevice]]] = {}
+
+
+def _get_cached_devices(
+    cache: Dict[str, Tuple[float, List[DiscoveredDevice]]], manager_path: str
+) -> Optional[List[DiscoveredDevice]]:
+    """返回未过期的设备列表副本（调用方会修改设备字段）"""
+    entry = cache.get(manager_path)
+    if entry and time.monotonic() - entry[0] < _DEVICE_LIST_TTL:
+        return [replace(dev) for dev in entry[1]]
+    return None
+
+
+def _store_cached_devices(
+    cache: Dict[str, Tuple[float, List[DiscoveredDevice]]],
+    manager_path: str,
+    devices: List[DiscoveredDevice],
+) -> None:
+    cache[manager_path] = (time.monotonic(), [replace(dev) for dev in devices])
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_path_cached(base_dir: str, candidates: Tuple[str, ...]) -> Optional[Path]:
+    """从候选相对路径中找到第一个存在的文件（模拟器安装目录在会话内基本不变，结果缓存）"""
+    # 基准目录来自进程可执行文件的绝对路径，字符串拼接 + normpath 即可消去 ".."，
+    # 不需要 resolve() 的额外系统调用
+    for rel in candidates:
+        path = os.path.normpath(os.path.join(base_dir, rel))
+        if os.path.isfile(path):
+            return Path(path)
+    return None
+
 
 class AdbDiscovery:
     """
@@ -149,21 +225,33 @@ class AdbDiscovery:
         emulators = self._scan_emulator_processes()
         logger.info(f"发现 {len(emulators)} 个模拟器进程")
 
+        # 解析 ADB 路径与管理工具路径
+        resolved = []
         for emu_def, pid, exe_path in emulators:
             base_dir = Path(exe_path).parent
+            resolved.append((
+                emu_def,
+                self._resolve_path(base_dir, emu_def.adb_candidates),
+                self._resolve_path(base_dir, emu_def.manager_candidates),
+            ))
+
+        # 多个 MuMu 进程指向同一个 MuMuManager 时只查询一次，
+        # 按 _MUMU_PRIORITY 选用 ADB 路径，同级优先已解析到 ADB 的进程
+        mumu_primary: Dict[Path, int] = {}
+        mumu_rank: Dict[Path, tuple] = {}
+        for i, (emu_def, adb_path, manager_path) in enumerate(resolved):
+            if emu_def.name not in _MUMU_PRIORITY or not manager_path:
+                continue
+            rank = (_MUMU_PRIORITY[emu_def.name], adb_path is None)
+            if manager_path not in mumu_rank or rank < mumu_rank[manager_path]:
+                mumu_primary[manager_path] = i
+                mumu_rank[manager_path] = rank
 
-            # 解析 ADB 路径
-            adb_path = self._resolve_path(base_dir, emu_def.adb_candidates)
-
-            # 解析管理工具路径
-            manager_path = self._resolve_path(base_dir, emu_def.manager_candidates)
-
+        for i, (emu_def, adb_path, manager_path) in enumerate(resolved):
             # 根据类型获取设备
-            emu_type = emu_def.name
-            if emu_type.startswith("mumu"):
-                emu_type = "mumu"
-
-            if emu_def.name in ("mumu", "mumu_v5", "mumu_service") and manager_path:
+            if emu_def.name in _MUMU_PRIORITY and manager_path:
+                if mumu_primary[manager_path] != i:
+                    continue
                 mumu_devices = self._get_mumu_devices(manager_path)
                 for dev in mumu_devices:
                     dev.adb_path = str(adb_path) if adb_path else dev.adb_path
@@ -180,8 +268,7 @@ class AdbDiscovery:
 
             elif emu_def.name == "bluestacks":
                 # BlueStacks 使用常见端口
-                for serial in ["127.0.0.1:5555", "127.0.0.1:5556",
-                               "127.0.0.1:5565", "127.0.0.1:5575"]:
+                for serial in _BLUESTACKS_SERIALS:
                     devices.append(DiscoveredDevice(
                         emulator_type="bluestacks",
                         serial=serial,
@@ -190,21 +277,17 @@ class AdbDiscovery:
                     ))
 
             elif emu_def.name in ("nox", "nox_vm"):
-                # 夜神模拟器: 默认端口 62001, 多开 +2
-                serial = "127.0.0.1:62001"
                 devices.append(DiscoveredDevice(
                     emulator_type="nox",
-                    serial=serial,
+                    serial=_NOX_DEFAULT_SERIAL,
                     adb_path=str(adb_path) if adb_path else None,
                     emulator_path=str(manager_path) if manager_path else None,
                 ))
 
             elif emu_def.name == "memu":
-                # MEmu/逍遥模拟器: 默认端口 21503, 多开 +10
-                serial = "127.0.0.1:21503"
                 devices.append(DiscoveredDevice(
                     emulator_type="memu",
-                    serial=serial,
+                    serial=_MEMU_DEFAULT_SERIAL,
                     adb_path=str(adb_path) if adb_path else None,
                     emulator_path=str(manager_path) if manager_path else None,
                 ))
@@ -214,49 +297,36 @@ class AdbDiscovery:
             adb_devices = self._get_devices_from_adb()
             devices.extend(adb_devices)
 
-        # 去重
-        seen_serials: set = set()
-        unique_devices: List[DiscoveredDevice] = []
+        # 按 serial 去重，保留首次出现的设备及其顺序
+        by_serial: Dict[str, DiscoveredDevice] = {}
         for dev in devices:
-            if dev.serial not in seen_serials:
-                seen_serials.add(dev.serial)
-                unique_devices.append(dev)
+            by_serial.setdefault(dev.serial, dev)
+        unique_devices = list(by_serial.values())
 
         logger.info(f"共发现 {len(unique_devices)} 个设备")
         return unique_devices
 
     def _scan_emulator_processes(self) -> List[tuple]:
         """扫描进程，返回 (EmulatorDef, pid, exe_path) 列表"""
-        try:
-            import psutil
-        except ImportError:
+        if not _HAS_PSUTIL:
             logger.warning("psutil 不可用，无法扫描进程")
             return []
 
         results = []
-        seen_pids: set = set()
 
         for proc in psutil.process_iter(["pid", "name"]):
-            try:
-                info = proc.info
-                pid = info.get("pid", 0)
-                name = info.get("name", "")
-
-                if pid in seen_pids:
-                    continue
-
-                for emu_def in _EMULATOR_DEFS:
-                    if emu_def.keyword and emu_def.keyword.lower() in name.lower():
-                        try:
-                            exe_path = proc.exe()
-                            results.append((emu_def, pid, exe_path))
-                            seen_pids.add(pid)
-                        except (psutil.AccessDenied, psutil.NoSuchProcess):
-                            pass
-                        break
-
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
+            # process_iter 已预取这两个属性，info 中一定有对应键；无权限时 name 为 None
+            info = proc.info
+            name_lower = (info["name"] or "").lower()
+
+            # 名称匹配后才调用 proc.exe()（额外的系统调用）
+            for keyword, emu_def in _EMULATOR_KEYWORDS:
+                if keyword in name_lower:
+                    try:
+                        results.append((emu_def, info["pid"], proc.exe()))
+                    except (psutil.AccessDenied, psutil.NoSuchProcess):
+                        pass
+                    break
 
         return results
 
@@ -264,11 +334,13 @@ class AdbDiscovery:
         self, base_dir: Path, candidates: List[str]
     ) -> Optional[Path]:
         """从候选相对路径中找到第一个存在的文件"""
-        for rel in candidates:
-            path = (base_dir / rel).resolve()
-            if path.exists():
-                return path
-        return None
+        return _resolve_path_cached(str(base_dir), tuple(candidates))
+
+    def clear_cache(self) -> None:
+        """清除路径解析与设备列表缓存（会话中重装或移动模拟器后调用）"""
+        _resolve_path_cached.cache_clear()
+        _mumu_devices_cache.clear()
+        _ldplayer_devices_cache.clear()
 
     def _get_mumu_devices(self, manager_path: str) -> List[DiscoveredDevice]:
         """
@@ -276,6 +348,10 @@ class AdbDiscovery:
 
         解析 JSON 获取 adb_host_ip 和 adb_port。
         """
+        cached = _get_cached_devices(_mumu_devices_cache, manager_path)
+        if cached is not None:
+            return cached
+
         devices: List[DiscoveredDevice] = []
         try:
             result = subprocess.run(
@@ -287,8 +363,7 @@ class AdbDiscovery:
                 logger.warning(f"MuMuManager info 失败: {stdout_text}")
                 return devices
 
-            raw_stdout = result.stdout.decode("utf-8", errors="ignore").strip()
-            data = json.loads(raw_stdout)
+            data = _parse_json_output(result.stdout or b"")
         except (subprocess.TimeoutExpired, json.JSONDecodeError, OSError) as e:
             logger.warning(f"MuMu 设备发现失败: {e}")
             return devices
@@ -325,6 +400,7 @@ class AdbDiscovery:
                     if dev:
                         devices.append(dev)
 
+        _store_cached_devices(_mumu_devices_cache, manager_path, devices)
         return devices
 
     def _get_ldplayer_devices(self, manager_path: str) -> List[DiscoveredDevice]:
@@ -333,6 +409,10 @@ class AdbDiscovery:
 
         解析 10 字段 CSV，使用 psutil 获取 ADB 端口。
         """
+        cached = _get_cached_devices(_ldplayer_devices_cache, manager_path)
+        if cached is not None:
+            return cached
+
         devices: List[DiscoveredDevice] = []
         try:
             result = subprocess.run(
@@ -347,14 +427,14 @@ class AdbDiscovery:
             logger.warning(f"LDPlayer 设备发现失败: {e}")
             return devices
 
-        stdout_text = result.stdout.decode("utf-8", errors="ignore").strip()
-        for line in stdout_text.splitlines():
-            parts = line.strip().split(",")
+        # 按 bytes 切分，只解码需要的字段（名称列可能不是 UTF-8）
+        for line in (result.stdout or b"").splitlines():
+            parts = line.strip().split(b",")
             if len(parts) < 10:
                 continue
 
             try:
-                idx = parts[0]
+                idx = parts[0].decode("ascii")
                 in_android = int(parts[4])
                 vbox_pid = int(parts[6])
 
@@ -376,14 +456,14 @@ class AdbDiscovery:
             except (ValueError, IndexError):
                 continue
 
+        _store_cached_devices(_ldplayer_devices_cache, manager_path, devices)
         return devices
 
     def _get_ldplayer_adb_port(self, vbox_pid: int) -> Optional[int]:
         """使用 psutil 从 vbox 进程的网络连接中获取 ADB 端口"""
-        if vbox_pid <= 0:
+        if vbox_pid <= 0 or not _HAS_PSUTIL:
             return None
         try:
-            import psutil
             proc = psutil.Process(vbox_pid)
             for conn in proc.net_connections(kind="inet"):
                 if conn.status == psutil.CONN_LISTEN and conn.laddr.port != 2222:
@@ -1,18 +1,41 @@
 """增强的模拟器管理器 - MuMu / LDPlayer 等命令行启停控制。"""
 
+import os
 import json
+import time
+import functools
+import shutil
 import asyncio
 import logging
+from contextvars import ContextVar
 from enum import IntEnum
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Any, Awaitable, Callable, Optional, Dict, FrozenSet, List, NamedTuple, Tuple
 from dataclasses import dataclass
 
+import psutil
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
 from .process_manager import ProcessRunner
 
 logger = logging.getLogger(__name__)
 
 
+def _loads_json(raw: str) -> Any:
+    """解析管理工具输出的 JSON（优先 orjson，其不接受的输出如 NaN 回退到标准库）"""
+    if _HAS_ORJSON:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
 # ---- 设备状态枚举 ----
 
 class DeviceStatus(IntEnum):
@@ -26,6 +49,32 @@ class DeviceStatus(IntEnum):
     UNKNOWN = 10
 
 
+# wait_ready / stop 结束等待的状态
+_READY_OR_FAILED = frozenset((DeviceStatus.ONLINE, DeviceStatus.ERROR, DeviceStatus.NOT_FOUND))
+_OFFLINE = frozenset((DeviceStatus.OFFLINE,))
+
+# 等待状态变化时的查询间隔（秒），按倍数退避
+_STATUS_POLL_MIN = 0.5
+_STATUS_POLL_MAX = 1.0
+
+# 进入 ONLINE 后等待 ADB 就绪的最长时间（秒）及探测间隔
+_ADB_READY_TIMEOUT = 3.0
+_ADB_PROBE_INTERVAL = 0.3
+
+# 管理工具查询结果（MuMuManager info / dnconsole list2）的复用时长（秒）
+_QUERY_CACHE_TTL = 1.5
+
+# 为 True 时 _cached_query 不使用已缓存的结果（只影响当前任务，见 BaseEmulator._get_status_fresh）
+_FRESH_QUERY: ContextVar[bool] = ContextVar("_FRESH_QUERY", default=False)
+
+# 雷电 vbox 进程 ADB 监听端口的复用时长（秒）；端口在进程存活期间不变，
+# 有效期只用于防止 PID 复用后拿到旧端口
+_ADB_PORT_TTL = 10.0
+
+# vbox_pid -> (查询时间, ADB 端口)，只缓存查到的端口
+_ADB_PORT_CACHE: Dict[int, Tuple[float, int]] = {}
+
+
 # ---- 数据类 ----
 
 @dataclass
@@ -38,6 +87,20 @@ class EmulatorInfo:
     pid: Optional[int] = None
 
 
+class _LDDevice(NamedTuple):
+    """dnconsole list2 的一行（10 个字段）"""
+    idx: int
+    title: str
+    top_hwnd: int
+    bind_hwnd: int
+    in_android: int
+    pid: int
+    vbox_pid: int
+    width: int
+    height: int
+    density: int
+
+
 # ---- 模拟器基类 ----
 
 class BaseEmulator:
@@ -51,6 +114,10 @@ class BaseEmulator:
         """
         self.manager_path = manager_path
         self.adb_path = adb_path
+        # 查询缓存: key -> (查询时间, 结果)
+        self._query_cache: Dict[str, Tuple[float, Any]] = {}
+        # 进行中的查询: key -> Task；同一 key 的并发调用共用一次子进程
+        self._inflight: Dict[str, "asyncio.Task[Any]"] = {}
 
     async def start(self, index: str) -> EmulatorInfo:
         raise NotImplementedError
@@ -69,16 +136,121 @@ class BaseEmulator:
 
     async def wait_ready(self, index: str, timeout: float = 120) -> bool:
         """等待模拟器就绪（ONLINE 状态）"""
-        deadline = asyncio.get_event_loop().time() + timeout
-        while asyncio.get_event_loop().time() < deadline:
-            status = await self.get_status(index)
-            if status == DeviceStatus.ONLINE:
-                await asyncio.sleep(3)  # 等待 ADB 服务完全就绪
-                return True
-            if status in (DeviceStatus.ERROR, DeviceStatus.NOT_FOUND):
-                return False
-            await asyncio.sleep(1)
-        return False
+        status = await self._wait_for_status(index, _READY_OR_FAILED, timeout)
+        if status != DeviceStatus.ONLINE:
+            return False
+        await self._wait_adb_ready(index)
+        return True
+
+    async def _wait_adb_ready(self, index: str) -> None:
+        """
+        等待 ADB 服务就绪，最多 _ADB_READY_TIMEOUT 秒
+
+        sys.boot_completed 为 1 即提前返回；找不到 ADB 或地址未知时按最长时间等待。
+        """
+        adb = self.adb_path or shutil.which("adb")
+        address = await self.get_adb_address(index)
+        if not adb or address == "Unknown":
+            await asyncio.sleep(_ADB_READY_TIMEOUT)
+            return
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + _ADB_READY_TIMEOUT
+        try:
+            if ":" in address:
+                await ProcessRunner.run(
+                    adb, "connect", address,
+                    timeout=max(deadline - loop.time(), 0.1), merge_stderr=True,
+                )
+            while True:
+                result = await ProcessRunner.run(
+                    adb, "-s", address, "shell", "getprop", "sys.boot_completed",
+                    timeout=max(deadline - loop.time(), 0.1), merge_stderr=True,
+                )
+                if result.stdout.strip() == "1":
+                    return
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return
+                await asyncio.sleep(min(_ADB_PROBE_INTERVAL, remaining))
+        except (asyncio.TimeoutError, OSError) as e:
+            logger.debug(f"ADB 就绪探测失败: {e}")
+            remaining = deadline - loop.time()
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+
+    async def _single_flight(self, key: str, query: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        合并同一 key 的并发查询
+
+        已有进行中的查询时直接等待其结果；shield 保证某个调用方被取消时
+        不会连带取消其他调用方共用的查询。
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(query())
+            self._inflight[key] = task
+
+            def _done(t: "asyncio.Task[Any]", key: str = key) -> None:
+                if self._inflight.get(key) is t:
+                    del self._inflight[key]
+
+            task.add_done_callback(_done)
+        return await asyncio.shield(task)
+
+    async def _cached_query(self, key: str, query: Callable[[], Awaitable[Any]]) -> Any:
+        """执行查询并缓存结果 _QUERY_CACHE_TTL 秒，查询失败不缓存"""
+        entry = self._query_cache.get(key)
+        if (
+            entry is not None
+            and not _FRESH_QUERY.get()
+            and time.monotonic() - entry[0] < _QUERY_CACHE_TTL
+        ):
+            return entry[1]
+
+        async def run() -> Any:
+            value = await query()
+            self._query_cache[key] = (time.monotonic(), value)
+            return value
+
+        return await self._single_flight(key, run)
+
+    async def _get_status_fresh(self, index: str) -> DeviceStatus:
+        """
+        跳过查询缓存获取状态，供轮询等待使用
+
+        缓存有效期长于轮询间隔，读缓存会让等待方晚一个有效期才看到状态变化；
+        正在进行中的查询仍会合并，其结果本身就是最新的。
+        """
+        token = _FRESH_QUERY.set(True)
+        try:
+            return await self.get_status(index)
+        finally:
+            _FRESH_QUERY.reset(token)
+
+    def _invalidate_queries(self) -> None:
+        """启停命令之后清除查询缓存"""
+        self._query_cache.clear()
+
+    async def _wait_for_status(
+        self, index: str, targets: FrozenSet[DeviceStatus], timeout: float
+    ) -> DeviceStatus:
+        """
+        等待状态进入 targets，超时返回最后一次查询到的状态
+
+        状态只能通过管理工具查询，每次都跳过查询缓存；查询间隔从 0.5 秒起倍增，
+        最长 1 秒，不慢于逐秒轮询，刚启动/关闭时能更快感知。
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = _STATUS_POLL_MIN
+        while True:
+            status = await self._get_status_fresh(index)
+            remaining = deadline - loop.time()
+            if status in targets or remaining <= 0:
+                return status
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, _STATUS_POLL_MAX)
 
 
 # ---- MuMu 模拟器 ----
@@ -108,6 +280,7 @@ class MuMuEmulator(BaseEmulator):
             timeout=60,
             merge_stderr=True,
         )
+        self._invalidate_queries()
         if result.returncode != 0:
             raise RuntimeError(f"MuMu 启动失败: {result.stdout}")
 
@@ -137,41 +310,29 @@ class MuMuEmulator(BaseEmulator):
             timeout=30,
             merge_stderr=True,
         )
+        self._invalidate_queries()
         if result.returncode != 0:
             logger.warning(f"MuMu 停止命令失败: {result.stdout}")
             return DeviceStatus.ERROR
 
         # 等待关闭
-        for _ in range(30):
-            s = await self.get_status(index)
-            if s == DeviceStatus.OFFLINE:
-                return DeviceStatus.OFFLINE
-            await asyncio.sleep(1)
-
-        return await self.get_status(index)
+        return await self._wait_for_status(index, _OFFLINE, 30)
 
     async def get_status(self, index: str) -> DeviceStatus:
         """获取 MuMu 模拟器状态"""
         try:
-            raw = await self._get_raw_info(index)
-            data = json.loads(raw)
+            data = await self._get_info_data(index)
         except Exception as e:
             logger.debug(f"MuMu 状态获取失败: {e}")
             return DeviceStatus.ERROR
 
-        if data.get("is_android_started"):
-            return DeviceStatus.ONLINE
-        elif data.get("is_process_started"):
-            return DeviceStatus.STARTING
-        else:
-            return DeviceStatus.OFFLINE
+        return self._parse_status(data)
 
     async def get_info(self, index: Optional[str] = None) -> Dict[str, EmulatorInfo]:
         """获取 MuMu 模拟器信息"""
         query_idx = index or "all"
         try:
-            raw = await self._get_raw_info(query_idx)
-            data = json.loads(raw)
+            data = await self._get_info_data(query_idx)
         except Exception as e:
             logger.warning(f"MuMu 信息获取失败: {e}")
             return {}
@@ -181,7 +342,8 @@ class MuMuEmulator(BaseEmulator):
         # 单个设备
         if isinstance(data, dict) and "index" in data and "name" in data:
             idx = str(data["index"])
-            status = await self.get_status(idx)
+            # 状态字段与信息在同一份 JSON 中，无需再逐个查询
+            status = self._parse_status(data)
             adb_addr = self._parse_adb_address(data)
             result[idx] = EmulatorInfo(
                 name=data.get("name", f"MuMu-{idx}"),
@@ -194,7 +356,7 @@ class MuMuEmulator(BaseEmulator):
             for value in data.values():
                 if isinstance(value, dict) and "index" in value:
                     idx = str(value["index"])
-                    status = await self.get_status(idx)
+                    status = self._parse_status(value)
                     adb_addr = self._parse_adb_address(value)
                     result[idx] = EmulatorInfo(
                         name=value.get("name", f"MuMu-{idx}"),
@@ -208,8 +370,7 @@ class MuMuEmulator(BaseEmulator):
     async def get_adb_address(self, index: str) -> str:
         """获取 MuMu ADB 地址"""
         try:
-            raw = await self._get_raw_info(index)
-            data = json.loads(raw)
+            data = await self._get_info_data(index)
             return self._parse_adb_address(data)
         except Exception:
             # MuMu 默认端口计算: 16384 + index * 32
@@ -219,6 +380,12 @@ class MuMuEmulator(BaseEmulator):
             except ValueError:
                 return "127.0.0.1:16384"
 
+    async def _get_info_data(self, index: str) -> Any:
+        """解析后的 MuMuManager info 结果（短时缓存，调用方不应修改）"""
+        async def query():
+            return _loads_json(await self._get_raw_info(index))
+        return await self._cached_query(f"info:{index}", query)
+
     async def _get_raw_info(self, index: str) -> str:
         """执行 MuMuManager.exe info -v {index}"""
         result = await ProcessRunner.run(
@@ -231,6 +398,16 @@ class MuMuEmulator(BaseEmulator):
             raise RuntimeError(f"MuMuManager info 失败: {result.stdout.strip()}")
         return result.stdout.strip()
 
+    @staticmethod
+    def _parse_status(data: dict) -> DeviceStatus:
+        """从 MuMuManager JSON 解析设备状态"""
+        if data.get("is_android_started"):
+            return DeviceStatus.ONLINE
+        elif data.get("is_process_started"):
+            return DeviceStatus.STARTING
+        else:
+            return DeviceStatus.OFFLINE
+
     @staticmethod
     def _parse_adb_address(data: dict) -> str:
         """从 MuMuManager JSON 解析 ADB 地址"""
@@ -268,6 +445,7 @@ class LDPlayerEmulator(BaseEmulator):
             timeout=60,
             merge_stderr=True,
         )
+        self._invalidate_queries()
         if result.returncode != 0:
             raise RuntimeError(f"LDPlayer 启动失败: {result.stdout}")
 
@@ -296,17 +474,12 @@ class LDPlayerEmulator(BaseEmulator):
             timeout=30,
             merge_stderr=True,
         )
+        self._invalidate_queries()
         if result.returncode != 0:
             logger.warning(f"LDPlayer 停止命令失败: {result.stdout}")
             return DeviceStatus.ERROR
 
-        for _ in range(30):
-            s = await self.get_status(index)
-            if s == DeviceStatus.OFFLINE:
-                return DeviceStatus.OFFLINE
-            await asyncio.sleep(1)
-
-        return await self.get_status(index)
+        return await self._wait_for_status(index, _OFFLINE, 30)
 
     async def get_status(self, index: str) -> DeviceStatus:
         """获取雷电模拟器状态"""
@@ -319,12 +492,10 @@ class LDPlayerEmulator(BaseEmulator):
         if index not in devices:
             return DeviceStatus.NOT_FOUND
 
-        in_android = devices[index].get("in_android", 0)
-        vbox_pid = devices[index].get("vbox_pid", 0)
-
-        if in_android == 1:
+        device = devices[index]
+        if device.in_android == 1:
             return DeviceStatus.ONLINE
-        elif in_android == 2 or vbox_pid > 0:
+        elif device.in_android == 2 or device.vbox_pid > 0:
             return DeviceStatus.STARTING
         else:
             return DeviceStatus.OFFLINE
@@ -342,10 +513,9 @@ class LDPlayerEmulator(BaseEmulator):
             if index is not None and idx != index:
                 continue
 
-            in_android = data.get("in_android", 0)
-            if in_android == 1:
+            if data.in_android == 1:
                 status = DeviceStatus.ONLINE
-            elif in_android == 2:
+            elif data.in_android == 2:
                 status = DeviceStatus.STARTING
             else:
                 status = DeviceStatus.OFFLINE
@@ -353,18 +523,18 @@ class LDPlayerEmulator(BaseEmulator):
             # 获取 ADB 端口
             adb_addr = "Unknown"
             if status == DeviceStatus.ONLINE:
-                adb_port = self._get_adb_port(data.get("vbox_pid", 0))
+                adb_port = self._get_adb_port(data.vbox_pid)
                 if adb_port:
                     adb_addr = f"127.0.0.1:{adb_port}"
                 else:
                     adb_addr = f"emulator-{5554 + int(idx) * 2}"
 
             result[idx] = EmulatorInfo(
-                name=data.get("title", f"LDPlayer-{idx}"),
+                name=data.title,
                 index=idx,
                 adb_address=adb_addr,
                 status=status,
-                pid=data.get("pid"),
+                pid=data.pid,
             )
 
         return result
@@ -376,7 +546,11 @@ class LDPlayerEmulator(BaseEmulator):
             return info[index].adb_address
         return "Unknown"
 
-    async def _get_device_list(self) -> Dict[str, dict]:
+    async def _get_device_list(self) -> Dict[str, _LDDevice]:
+        """dnconsole.exe list2 的设备列表（短时缓存，调用方不应修改）"""
+        return await self._cached_query("list2", self._query_device_list)
+
+    async def _query_device_list(self) -> Dict[str, _LDDevice]:
         """执行 dnconsole.exe list2 并解析 10 字段 CSV"""
         result = await ProcessRunner.run(
             self.manager_path,
@@ -387,40 +561,34 @@ class LDPlayerEmulator(BaseEmulator):
         if result.returncode != 0:
             raise RuntimeError(f"dnconsole list2 失败: {result.stdout}")
 
-        devices: Dict[str, dict] = {}
+        devices: Dict[str, _LDDevice] = {}
         for line in result.stdout.strip().splitlines():
             parts = line.strip().split(",")
             if len(parts) < 10:
                 continue
             try:
-                idx = parts[0]
-                devices[idx] = {
-                    "idx": int(parts[0]),
-                    "title": parts[1],
-                    "top_hwnd": int(parts[2]),
-                    "bind_hwnd": int(parts[3]),
-                    "in_android": int(parts[4]),
-                    "pid": int(parts[5]),
-                    "vbox_pid": int(parts[6]),
-                    "width": int(parts[7]),
-                    "height": int(parts[8]),
-                    "density": int(parts[9]),
-                }
-            except (ValueError, IndexError):
+                devices[parts[0]] = _LDDevice(
+                    int(parts[0]), parts[1], *map(int, parts[2:10])
+                )
+            except ValueError:
                 continue
 
         return devices
 
     @staticmethod
     def _get_adb_port(vbox_pid: int) -> Optional[int]:
-        """使用 psutil 从 vbox 进程网络连接获取 ADB 端口"""
+        """使用 psutil 从 vbox 进程网络连接获取 ADB 端口（只查 TCP 监听）"""
         if vbox_pid <= 0:
             return None
+        now = time.monotonic()
+        entry = _ADB_PORT_CACHE.get(vbox_pid)
+        if entry is not None and now - entry[0] < _ADB_PORT_TTL:
+            return entry[1]
         try:
-            import psutil
             proc = psutil.Process(vbox_pid)
-            for conn in proc.net_connections(kind="inet"):
+            for conn in proc.net_connections(kind="tcp"):
                 if conn.status == psutil.CONN_LISTEN and conn.laddr.port != 2222:
+                    _ADB_PORT_CACHE[vbox_pid] = (now, conn.laddr.port)
                     return conn.laddr.port
         except Exception:
             pass
@@ -471,7 +639,6 @@ class BlueStacksEmulator(BaseEmulator):
     async def stop(self, index: str) -> DeviceStatus:
         """停止 BlueStacks（通过终止进程）"""
         try:
-            import psutil
             for proc in psutil.process_iter(["name"]):
                 try:
                     if proc.info["name"] and "HD-Player" in proc.info["name"]:
@@ -482,12 +649,7 @@ class BlueStacksEmulator(BaseEmulator):
             logger.warning(f"BlueStacks 停止失败: {e}")
             return DeviceStatus.ERROR
 
-        for _ in range(15):
-            s = await self.get_status(index)
-            if s == DeviceStatus.OFFLINE:
-                return DeviceStatus.OFFLINE
-            await asyncio.sleep(1)
-        return await self.get_status(index)
+        return await self._wait_for_status(index, _OFFLINE, 15)
 
     async def get_status(self, index: str) -> DeviceStatus:
         """通过 ADB 连接检查 BlueStacks 状态"""
@@ -519,10 +681,14 @@ class BlueStacksEmulator(BaseEmulator):
         return f"127.0.0.1:{port}"
 
     async def _check_adb_device(self, address: str) -> DeviceStatus:
-        """通过 ADB 检查设备状态"""
+        """通过 ADB 检查设备状态，同一地址的并发检查共用一次 adb connect"""
+        return await self._single_flight(
+            f"adb:{address}", lambda: self._connect_adb_device(address)
+        )
+
+    async def _connect_adb_device(self, address: str) -> DeviceStatus:
         if not self.adb_path:
             # 尝试查找系统 ADB
-            import shutil
             adb = shutil.which("adb")
             if not adb:
                 return DeviceStatus.UNKNOWN
@@ -571,6 +737,7 @@ class NoxEmulator(BaseEmulator):
             )
         except asyncio.TimeoutError:
             pass  # Nox.exe 不会立即退出
+        self._invalidate_queries()
 
         if await self.wait_ready(index, timeout=120):
             info = await self.get_info(index)
@@ -597,31 +764,42 @@ class NoxEmulator(BaseEmulator):
         except Exception as e:
             logger.warning(f"Nox 停止失败: {e}")
             return DeviceStatus.ERROR
+        self._invalidate_queries()
 
-        for _ in range(15):
-            s = await self.get_status(index)
-            if s == DeviceStatus.OFFLINE:
-                return DeviceStatus.OFFLINE
-            await asyncio.sleep(1)
-        return await self.get_status(index)
+        return await self._wait_for_status(index, _OFFLINE, 15)
 
     async def get_status(self, index: str) -> DeviceStatus:
         """通过进程检查 Nox 状态"""
         try:
-            import psutil
-            for proc in psutil.process_iter(["name", "cmdline"]):
-                try:
-                    if proc.info["name"] and "nox" in proc.info["name"].lower():
-                        cmdline = proc.info.get("cmdline") or []
-                        clone_name = f"Nox_{index}" if index != "0" else "Nox_0"
-                        if any(clone_name in arg for arg in cmdline) or index == "0":
-                            return DeviceStatus.ONLINE
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
+            cmdlines = await self._cached_query("nox_procs", self._scan_nox_processes)
         except Exception:
-            pass
+            return DeviceStatus.OFFLINE
+        if not cmdlines:
+            return DeviceStatus.OFFLINE
+        if index == "0":
+            return DeviceStatus.ONLINE
+        clone_name = f"Nox_{index}"
+        if any(clone_name in arg for cmdline in cmdlines for arg in cmdline):
+            return DeviceStatus.ONLINE
         return DeviceStatus.OFFLINE
 
+    @staticmethod
+    async def _scan_nox_processes() -> List[List[str]]:
+        """返回所有 Nox 相关进程的命令行；只按进程名预筛，命中后才读取命令行"""
+        cmdlines = []
+        for proc in psutil.process_iter(["name"]):
+            name = proc.info["name"]
+            if not name or "nox" not in name.lower():
+                continue
+            try:
+                cmdlines.append(proc.cmdline())
+            except psutil.AccessDenied:
+                # 读不到命令行也说明 Nox 进程存在
+                cmdlines.append([])
+            except psutil.NoSuchProcess:
+                continue
+        return cmdlines
+
     async def get_info(self, index: Optional[str] = None) -> Dict[str, EmulatorInfo]:
         idx = index or "0"
         status = await self.get_status(idx)
@@ -676,7 +854,10 @@ class GeneralEmulator(BaseEmulator):
         return DeviceStatus.UNKNOWN
 
     async def get_status(self, index: str) -> DeviceStatus:
-        """通过 ADB 检查设备状态"""
+        """通过 ADB 检查设备状态，并发检查共用一次 adb connect"""
+        return await self._single_flight("status", self._connect_default_address)
+
+    async def _connect_default_address(self) -> DeviceStatus:
         adb = self.adb_path or self.manager_path
         address = self.default_address
         try:
@@ -708,6 +889,19 @@ class GeneralEmulator(BaseEmulator):
 
 # ---- 模拟器管理器 ----
 
+@functools.lru_cache(maxsize=128)
+def _interned_path(path: str) -> Path:
+    """
+    将配置中的路径转为 Path，同一字符串共用一个对象
+
+    带目录的路径转为绝对路径（abspath 不访问文件系统，也不展开符号链接）；
+    "adb" 这类裸命令名保持原样，仍由 PATH 查找。
+    """
+    if os.path.dirname(path):
+        path = os.path.abspath(path)
+    return Path(path)
+
+
 class EmulatorManager:
     """
     模拟器管理器 - 注册和管理多个模拟器实例
@@ -741,8 +935,8 @@ class EmulatorManager:
 
         cls = self.EMULATOR_TYPES[emulator_type]
         kwargs = {
-            "manager_path": Path(manager_path),
-            "adb_path": Path(adb_path) if adb_path else None,
+            "manager_path": _interned_path(manager_path),
+            "adb_path": _interned_path(adb_path) if adb_path else None,
         }
         if emulator_type == "general" and default_address:
             kwargs["default_address"] = default_address
@@ -792,11 +986,17 @@ class EmulatorManager:
                 raise ValueError(f"模拟器未注册: {emulator_id}")
             result[emulator_id] = await self.emulators[emulator_id].get_info(index)
         else:
-            for emu_id, emu in self.emulators.items():
-                try:
-                    result[emu_id] = await emu.get_info(index)
-                except Exception as e:
-                    logger.warning(f"获取 {emu_id} 信息失败: {e}")
+            # 各模拟器的查询相互独立，并发执行
+            emu_ids = list(self.emulators)
+            infos = await asyncio.gather(
+                *(self.emulators[emu_id].get_info(index) for emu_id in emu_ids),
+                return_exceptions=True,
+            )
+            for emu_id, info in zip(emu_ids, infos):
+                if isinstance(info, BaseException):
+                    logger.warning(f"获取 {emu_id} 信息失败: {info}")
+                else:
+                    result[emu_id] = info
         return result
 
     async def wait_ready(
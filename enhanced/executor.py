@@ -19,8 +19,37 @@ from .log_monitor import EnhancedLogMonitor
 from .emulator_manager import EmulatorManager, EmulatorInfo, DeviceStatus
 from .notification import TaskNotifier
 
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
+
+def _read_json(path: Path) -> Any:
+    """读取 MAA 的 JSON 配置（优先使用 orjson，仅用于解析）"""
+    raw = path.read_bytes()
+    return orjson.loads(raw) if _HAS_ORJSON else json.loads(raw)
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """
+    写回 MAA 的 JSON 配置（保留非 ASCII 字符），内容未变时不写盘
+
+    固定用标准库按 4 空格缩进输出：与 MAA 自身写出的格式一致，
+    且落盘格式不随是否安装 orjson 而变化。
+    """
+    raw = json.dumps(data, ensure_ascii=False, indent=4).encode("utf-8")
+    try:
+        if path.read_bytes() == raw:
+            return
+    except OSError:
+        pass
+    path.write_bytes(raw)
+
+
 # ---- 内联 MAA 常量（原 maa_comms.script_config.constants）----
 
 MAA_TASKS = [
@@ -497,8 +526,8 @@ class EnhancedMAAExecutor:
         gui_json_path = self.maa_config_dir / "gui.json"
         gui_new_json_path = self.maa_config_dir / "gui.new.json"
 
-        gui_set = json.loads(gui_json_path.read_text(encoding="utf-8"))
-        gui_new_set = json.loads(gui_new_json_path.read_text(encoding="utf-8"))
+        gui_set = _read_json(gui_json_path)
+        gui_new_set = _read_json(gui_new_json_path)
 
         # 使用 Default 配置
         if gui_set.get("Current") != "Default":
@@ -547,12 +576,8 @@ class EnhancedMAAExecutor:
         gui_new_set["Configurations"]["Default"]["TaskQueue"] = task_queue
 
         # 保存
-        gui_json_path.write_text(
-            json.dumps(gui_set, ensure_ascii=False, indent=4), encoding="utf-8"
-        )
-        gui_new_json_path.write_text(
-            json.dumps(gui_new_set, ensure_ascii=False, indent=4), encoding="utf-8"
-        )
+        _write_json(gui_json_path, gui_set)
+        _write_json(gui_new_json_path, gui_new_set)
 
         # B服协议
         if self.config.client_type == "Bilibili":
@@ -1012,10 +1037,8 @@ class EnhancedMAAExecutor:
         """设置 B服协议"""
         if not self.maa_tasks_json.exists():
             return
-        tasks_data = json.loads(self.maa_tasks_json.read_text(encoding="utf-8"))
-        self.maa_tasks_json.write_text(
-            json.dumps(tasks_data, ensure_ascii=False, indent=4), encoding="utf-8"
-        )
+        tasks_data = _read_json(self.maa_tasks_json)
+        _write_json(self.maa_tasks_json, tasks_data)
 
     def _notify(self, text: str, auto_hide_ms: int = 5000) -> None:
         """推送状态通知"""